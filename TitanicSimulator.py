@@ -2,12 +2,41 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog, simpledialog
 import datetime
 import os
-import matplotlib.patches as patches
-import matplotlib.transforms as mtransforms
 import csv
+import threading
+
+import batch
+import breaches
+import calibration
+import engine
+import evacuation
+import events
+import export
+import forcing
+import scene
+import strength
+import surrogate
+import survival
+
+# Slider range and rounding (decimal digits, as for round()) of each engine parameter
+SLIDER_RANGES = {
+    'ship_mass': (3.0e7, 8.0e7, -5),
+    'ship_volume': (40000, 100000, -2),
+    'water_density': (1000, 1050, 0),
+    'leak_rate': (50, 2000, 0),
+    'compartments': (1, 32, 0),
+    'breached_compartments': (1, 32, 0),
+    'simulation_time': (30, 600, 0),
+    'temperature': (-4, 30, 1),
+    'wind_speed': (0, 40, 1),
+}
+SCRUB_DELAY_MS = 15         # coalescing window for live re-simulation while dragging
+SCRUB_HEADROOM = 1.25       # axis room left around the data so most updates skip a full redraw
+SCRUB_SETTLE_MS = 300       # pause after the last edit before the live run becomes the current one
+EXPORT_POLL_MS = 100        # how often the Tk loop checks on background exports
 
 class TitanicSinkingSimulator:
     def __init__(self, master):
@@ -30,6 +59,8 @@ class TitanicSinkingSimulator:
         self.simulation_time = tk.DoubleVar(value=180)  # min
         self.temperature = tk.DoubleVar(value=-2)       # °C
         self.wind_speed = tk.DoubleVar(value=10)        # m/s
+        self.breaches = None                            # breaches.Breaches, replaces leak rate when set
+        self.forcing = None                             # forcing.ForcingSeries, replaces wind and temperature
         
         # Animation control variables
         self.is_running = False
@@ -37,6 +68,13 @@ class TitanicSinkingSimulator:
         self.animation_speed = tk.DoubleVar(value=1.0)  # Speed multiplier
         
         self.status_var = tk.StringVar(value="Ready")
+        self.preview_var = tk.StringVar(value="")
+        self.preview = None
+        self.surrogate_table = None
+        self._preview_job = None
+        self._scrub_job = None
+        self._settle_job = None
+        self.scrub_background = None
         
         self.create_menu()
         self.setup_ui()
@@ -45,6 +83,12 @@ class TitanicSinkingSimulator:
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
         self.refresh()
+        
+        # Instant estimates while editing; the lookup table is loaded (or built) off the Tk thread
+        for var in self.get_param_vars().values():
+            var.trace_add('write', self.schedule_preview)
+            var.trace_add('write', self.schedule_scrub)
+        threading.Thread(target=self.load_surrogate, daemon=True).start()
 
     def create_menu(self):
         menubar = tk.Menu(self.master)
@@ -53,14 +97,21 @@ class TitanicSinkingSimulator:
         file_menu.add_command(label="New Simulation", command=self.refresh)
         file_menu.add_command(label="Save Results", command=self.save_results)
         file_menu.add_command(label="Save Graph", command=self.save_graph)
+        file_menu.add_command(label="Export Animation", command=self.export_animation)
+        file_menu.add_separator()
+        file_menu.add_command(label="Load Breach Geometry", command=self.load_breaches)
+        file_menu.add_command(label="Clear Breach Geometry", command=self.clear_breaches)
+        file_menu.add_command(label="Load Forcing Series", command=self.load_forcing)
+        file_menu.add_command(label="Clear Forcing Series", command=self.clear_forcing)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.master.quit)
         menubar.add_cascade(label="File", menu=file_menu)
         
         presets_menu = tk.Menu(menubar, tearoff=0)
-        presets_menu.add_command(label="Historical Accuracy", command=self.preset_historical)
-        presets_menu.add_command(label="Worst Case", command=self.preset_worst_case)
-        presets_menu.add_command(label="Best Case", command=self.preset_best_case)
+        for preset in batch.load_scenarios(batch.PRESETS_FILE):
+            presets_menu.add_command(label=preset['name'], command=self.preset_command(preset))
+        presets_menu.add_separator()
+        presets_menu.add_command(label="Calibrate to Historical Timeline", command=self.calibrate_historical)
         menubar.add_cascade(label="Presets", menu=presets_menu)
         
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -80,30 +131,51 @@ class TitanicSinkingSimulator:
         ship_frame = ttk.LabelFrame(control_frame, text="Ship Properties")
         ship_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        def add_param(parent, label, var, row, unit=""):
+        def add_param(parent, label, var, row, unit="", slider=None):
             ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, pady=2, padx=5)
             entry = ttk.Entry(parent, textvariable=var, width=10)
             entry.grid(row=row, column=1, pady=2, padx=5)
             if unit:
                 ttk.Label(parent, text=unit).grid(row=row, column=2, sticky=tk.W, pady=2)
+            if slider:
+                add_slider(parent, var, row, *slider)
+        
+        def add_slider(parent, var, row, low, high, digits):
+            # The scale keeps its own variable so dragging writes rounded values to the entry
+            scale_var = tk.DoubleVar(value=var.get())
+            
+            def on_drag(value):
+                value = round(float(value), digits)
+                var.set(int(value) if isinstance(var, tk.IntVar) else value)
+            
+            def on_edit(*args):
+                try:
+                    scale_var.set(var.get())
+                except tk.TclError:
+                    pass
+            
+            ttk.Scale(parent, from_=low, to=high, orient=tk.HORIZONTAL, variable=scale_var,
+                      command=on_drag, length=100).grid(row=row, column=3, pady=2, padx=5, sticky=tk.EW)
+            var.trace_add('write', on_edit)
         
-        add_param(ship_frame, "Ship Mass:", self.ship_mass, 0, "kg")
-        add_param(ship_frame, "Ship Volume:", self.ship_volume, 1, "m³")
-        add_param(ship_frame, "Compartments:", self.compartments, 2, "")
-        add_param(ship_frame, "Damaged Compartments:", self.breached_compartments, 3, "")
+        add_param(ship_frame, "Ship Mass:", self.ship_mass, 0, "kg", SLIDER_RANGES['ship_mass'])
+        add_param(ship_frame, "Ship Volume:", self.ship_volume, 1, "m³", SLIDER_RANGES['ship_volume'])
+        add_param(ship_frame, "Compartments:", self.compartments, 2, "", SLIDER_RANGES['compartments'])
+        add_param(ship_frame, "Damaged Compartments:", self.breached_compartments, 3, "",
+                  SLIDER_RANGES['breached_compartments'])
         
         env_frame = ttk.LabelFrame(control_frame, text="Environment")
         env_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        add_param(env_frame, "Water Density:", self.water_density, 0, "kg/m³")
-        add_param(env_frame, "Water Temperature:", self.temperature, 1, "°C")
-        add_param(env_frame, "Wind Speed:", self.wind_speed, 2, "m/s")
+        add_param(env_frame, "Water Density:", self.water_density, 0, "kg/m³", SLIDER_RANGES['water_density'])
+        add_param(env_frame, "Water Temperature:", self.temperature, 1, "°C", SLIDER_RANGES['temperature'])
+        add_param(env_frame, "Wind Speed:", self.wind_speed, 2, "m/s", SLIDER_RANGES['wind_speed'])
         
         sim_frame = ttk.LabelFrame(control_frame, text="Simulation Settings")
         sim_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        add_param(sim_frame, "Leak Rate:", self.leak_rate, 0, "m³/min")
-        add_param(sim_frame, "Simulation Time:", self.simulation_time, 1, "min")
+        add_param(sim_frame, "Leak Rate:", self.leak_rate, 0, "m³/min", SLIDER_RANGES['leak_rate'])
+        add_param(sim_frame, "Simulation Time:", self.simulation_time, 1, "min", SLIDER_RANGES['simulation_time'])
         
         ttk.Label(sim_frame, text="Animation Speed:").grid(row=2, column=0, sticky=tk.W, pady=2, padx=5)
         speed_scale = ttk.Scale(sim_frame, from_=0.1, to=3.0, orient=tk.HORIZONTAL, 
@@ -117,24 +189,29 @@ class TitanicSinkingSimulator:
         self.pause_button = ttk.Button(button_frame, text="Pause", command=self.pause_simulation, state=tk.DISABLED)
         self.pause_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Reset", command=self.refresh).pack(side=tk.LEFT, padx=5)
+        self.extend_button = ttk.Button(button_frame, text="Extend Run", command=self.extend_run, state=tk.DISABLED)
+        self.extend_button.pack(side=tk.LEFT, padx=5)
         
         results_frame = ttk.LabelFrame(control_frame, text="Results")
         results_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        ttk.Label(results_frame, textvariable=self.preview_var, foreground='gray',
+                  wraplength=220, justify=tk.LEFT).pack(fill=tk.X, padx=5, pady=(5, 0))
+        
         self.results_text = tk.Text(results_frame, height=10, width=30, state=tk.DISABLED)
         self.results_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         viz_frame = ttk.Frame(main_frame)
         viz_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
-        notebook = ttk.Notebook(viz_frame)
-        notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook = ttk.Notebook(viz_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
         
-        graph_frame = ttk.Frame(notebook)
-        notebook.add(graph_frame, text="Forces Graph")
+        graph_frame = ttk.Frame(self.notebook)
+        self.notebook.add(graph_frame, text="Forces Graph")
         
-        ship_viz_frame = ttk.Frame(notebook)
-        notebook.add(ship_viz_frame, text="Ship Visualization")
+        ship_viz_frame = ttk.Frame(self.notebook)
+        self.notebook.add(ship_viz_frame, text="Ship Visualization")
         
         self.fig, self.ax = plt.subplots(figsize=(6, 4))
         self.canvas = FigureCanvasTkAgg(self.fig, master=graph_frame)
@@ -143,26 +220,47 @@ class TitanicSinkingSimulator:
         self.ship_fig, self.ship_ax = plt.subplots(figsize=(6, 4))
         self.ship_canvas = FigureCanvasTkAgg(self.ship_fig, master=ship_viz_frame)
         self.ship_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Artists are created once here and reused by every run
+        self.forces_scene = scene.ForcesScene(self.ax)
+        self.ship_scene = scene.ShipScene(self.ship_ax)
+        
+        # Only the selected tab is drawn; the other catches up when it is selected
+        self.canvas_tabs = {self.canvas: graph_frame, self.ship_canvas: ship_viz_frame}
+        self.stale_canvases = set()
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+
+    def tab_visible(self, canvas):
+        return self.notebook.select() == str(self.canvas_tabs[canvas])
+
+    def draw_canvas(self, canvas):
+        """Draw canvas now if its tab is showing, otherwise once it is selected"""
+        if self.tab_visible(canvas):
+            canvas.draw()
+            self.stale_canvases.discard(canvas)
+        else:
+            self.stale_canvases.add(canvas)
+
+    def on_tab_changed(self, event):
+        for canvas in list(self.stale_canvases):
+            if self.tab_visible(canvas):
+                canvas.draw()
+                self.stale_canvases.discard(canvas)
 
     def refresh(self):
+        self.cancel_settle()
         self.is_running = False
         self.is_paused = False
         self.pause_button.config(state=tk.DISABLED)
+        self.extend_button.config(state=tk.DISABLED)
+        self.result = None
+        self.scrub_background = None
         
-        self.ax.clear()
-        self.ax.set_title("Titanic Sinking Simulation")
-        self.ax.set_xlabel("Time (min)")
-        self.ax.set_ylabel("Force (N)")
-        self.ax.grid(True)
-        self.canvas.draw()
-        
-        self.ship_ax.clear()
-        self.ship_ax.set_title("Ship Status Visualization")
-        self.ship_ax.set_ylim(-1, 1)
-        self.ship_ax.set_xlim(0, 10)
-        self.ship_ax.axis('equal')
-        self.ship_ax.axis('off')
-        self.ship_canvas.draw()
+        self.forces_scene.reset()
+        self.draw_canvas(self.canvas)
+        
+        self.ship_scene.reset()
+        self.draw_canvas(self.ship_canvas)
         
         self.results_text.config(state=tk.NORMAL)
         self.results_text.delete(1.0, tk.END)
@@ -196,19 +294,23 @@ class TitanicSinkingSimulator:
                 
             if self.breached_compartments.get() <= 0 or self.breached_compartments.get() > self.compartments.get():
                 raise ValueError("Damaged compartments must be between 1 and total compartments")
+                
+            if self.breaches is not None and self.breaches.compartment.max() >= self.compartments.get():
+                raise ValueError("Breach compartment must be less than the number of compartments")
         except ValueError as e:
             return messagebox.showerror("Invalid Input", str(e))
 
         self.status_var.set("Running simulation...")
         self.is_running = True
         self.pause_button.config(state=tk.NORMAL)
+        self.extend_button.config(state=tk.DISABLED)
         
         self.calculate_simulation()
         
         self.setup_plots()
         
         self.ani_idx = 0
-        self.max_idx = len(self.time_pts)
+        self.max_idx = len(self.result)
         self.delay_ms = max(10, int(1000 * self.simulation_time.get() / 
                            (self.max_idx * self.animation_speed.get())))
         
@@ -216,239 +318,243 @@ class TitanicSinkingSimulator:
 
     def calculate_simulation(self):
         """Calculate all simulation data points"""
-        T = self.simulation_time.get()
-        self.time_pts = np.linspace(0, T, 300)
-        
-        # Get parameters
-        ship_mass = self.ship_mass.get()
-        ship_volume = self.ship_volume.get()
-        water_density = self.water_density.get()
-        compartments = self.compartments.get()
-        damaged = self.breached_compartments.get()
-        
-        # Adjust water density based on temperature
-        # Standard formula for seawater density variation with temperature
-        temp_factor = 1.0 - 0.000214 * (self.temperature.get() + 2)
-        adjusted_density = water_density * temp_factor
-        
-        # Calculate compartment size - extension of standard formula: Vtotal = L × B × D × Cb
-        # Here we divide total volume by number of compartments
-        compartment_size = ship_volume / compartments
-        
-        # WATER FLOW CALCULATION
-        # Standard formula: Q = CdA√(2gh) where:
-        # - Cd = discharge coefficient
-        # - A = area of breach
-        # - g = gravitational acceleration
-        # - h = pressure head (depth)
-        
-        # Our implementation uses a modified approach to model progressive flooding:
-        initial_leak_rate = self.leak_rate.get() * (damaged / compartments)
-        
-        # Initialize water volume array - will track volume over time
-        # Relates to standard volume formula: Vsub(t) = m(t)/ρ
-        water_vol = np.zeros_like(self.time_pts)
-        current_vol = 0
-        filled_compartments = 0
-        
-        for i, t in enumerate(self.time_pts):
-            if i == 0:
-                water_vol[i] = 0
-                continue
-                
-            dt = self.time_pts[i] - self.time_pts[i-1]
-            
-            # Track how many compartments are filled - drives progressive flooding
-            filled_compartments = min(damaged, current_vol / compartment_size)
-            
-            # MODIFIED WATER FLOW MODEL
-            # Standard: Q = CdA√(2gh)
-            # Our model: Q = Q_initial × (1 + k × filled_compartments) × wind_factor
-            # This captures cascading failure effect as compartments fill
-            wind_factor = 1.0 + (self.wind_speed.get() / 100)
-            current_leak_rate = initial_leak_rate * (1 + 0.3 * filled_compartments) * wind_factor
+        self.cancel_settle()
+        params = self.get_params()
+        result = engine.simulate(breaches=self.breaches, forcing=self.forcing, **params)
+        self.run_preview = self.preview
+        self.apply_result(result, params)
+
+    def extend_run(self):
+        """Continue the last run from where it stopped instead of recomputing from t=0"""
+        if self.is_running or self.result is None:
+            return
+        minutes = simpledialog.askfloat("Extend Run", "Continue the run for how many more minutes?",
+                                        initialvalue=self.simulation_time.get(), minvalue=1, parent=self.master)
+        if minutes is None:
+            return
+        
+        self.status_var.set("Extending simulation...")
+        self.is_running = True
+        self.pause_button.config(state=tk.NORMAL)
+        self.extend_button.config(state=tk.DISABLED)
+        
+        # Same parameters as the run being extended, whatever the controls show now
+        params = dict(self.run_params, simulation_time=round(self.result.time_pts[-1] + minutes, 1))
+        start_idx = len(self.result) - 1
+        result = engine.extend(self.result, params['simulation_time'], breaches=self.breaches,
+                               forcing=self.forcing, **{name: value for name, value in self.run_params.items()
+                                                        if name != 'simulation_time'})
+        self.simulation_time.set(params['simulation_time'])
+        self.apply_result(result, params)
+        
+        self.setup_plots()
+        self.ani_idx = start_idx
+        self.max_idx = len(self.result)
+        self.delay_ms = max(10, int(1000 * self.simulation_time.get() /
+                           (self.max_idx * self.animation_speed.get())))
+        self.master.after(0, self.update_frame)
+
+    def apply_result(self, result, params):
+        """Keep an engine result and derive evacuation, survival and hull loads from it"""
+        self.result = result
+        self.run_params = params
+        
+        # Exact event timeline of the cascading model (not available for breach geometry or forcing)
+        if self.breaches is None and self.forcing is None:
+            self.flood_events = events.simulate_events(**params)['events']
+        else:
+            self.flood_events = []
+        
+        # Passengers and crew heading for the boats as the ship floods
+        self.evacuation = evacuation.evacuate(result, seed=0, compartments=params['compartments'],
+                                             ship_volume=params['ship_volume'])
+        self.survivors = survival.survivors_over_time(
+            self.evacuation['immersion_time'], self.result.time_pts, params['temperature'], forcing=self.forcing)
+        self.rescued = survival.survivors_at_rescue(
+            self.evacuation['immersion_time'], self.result.time_pts, params['temperature'], forcing=self.forcing)
+        
+        # Hull girder loads along the ship, for break-up prediction
+        hull = strength.longitudinal_strength(result, forcing=self.forcing, **params)
+        self.max_moment = hull['max_moment']
+        self.break_time = hull['break_time']
+        self.break_station = hull['break_station']
+
+    def get_param_vars(self):
+        """Tk variables of the engine parameters, keyed by engine parameter name"""
+        return {
+            'ship_mass': self.ship_mass,
+            'ship_volume': self.ship_volume,
+            'water_density': self.water_density,
+            'leak_rate': self.leak_rate,
+            'compartments': self.compartments,
+            'breached_compartments': self.breached_compartments,
+            'simulation_time': self.simulation_time,
+            'temperature': self.temperature,
+            'wind_speed': self.wind_speed,
+        }
+
+    def get_params(self):
+        """Current parameter values as keyword arguments for the engine"""
+        return {name: var.get() for name, var in self.get_param_vars().items()}
+
+    def load_surrogate(self):
+        table = surrogate.load()
+        self.master.after(0, self.surrogate_loaded, table)
+
+    def surrogate_loaded(self, table):
+        self.surrogate_table = table
+        self.update_preview()
+
+    def schedule_preview(self, *args):
+        if self._preview_job is not None:
+            self.master.after_cancel(self._preview_job)
+        self._preview_job = self.master.after(50, self.update_preview)
+
+    def update_preview(self):
+        """Estimated event times from the surrogate table, refreshed as parameters change"""
+        self._preview_job = None
+        self.preview = None
+        if self.breaches is not None or self.forcing is not None:
+            self.preview_var.set("Preview not available with breach geometry or forcing")
+            return
+        if self.surrogate_table is None:
+            self.preview_var.set("Preview: preparing lookup table...")
+            return
+        try:
+            params = self.get_params()
+            engine.validate_params(engine.broadcast_params(**params))
+        except (tk.TclError, ValueError):
+            self.preview_var.set("")
+            return
             
-            # Calculate volume change: dV = Q × dt
-            # Standard mass formula: m(t) = m0 + ρwater·Q·t
-            # We track volume directly: V(t) = V0 + Q·t
-            dv = current_leak_rate * dt
-            current_vol += dv
-            water_vol[i] = min(current_vol, ship_volume)  # Cap at ship volume
-        
-        # BUOYANCY CALCULATION
-        # Standard formula: Fb = ρ × g × Vsub (Archimedes' principle)
-        # where Vsub is the submerged volume (volume displacing water)
-        displaced_volume = np.maximum(0, ship_volume - water_vol)
-        self.buoyancy = displaced_volume * adjusted_density * 9.81  # g = 9.81 m/s²
-        
-        # WEIGHT CALCULATION
-        # Standard formula: Fw = m × g
-        self.ship_weight = ship_mass * 9.81  # g = 9.81 m/s²
-        
-        # Net force determines if ship sinks or floats
-        # When Fb < Fw, ship begins to sink rapidly
-        self.net_force = self.buoyancy - self.ship_weight
-        
-        # SINKING PERCENTAGE
-        # Related to sinking condition: Vsub(t) ≥ Vtotal
-        # We track percent of volume filled with water
-        self.sink_pct = np.minimum(water_vol / ship_volume, 1) * 100
-        
-        # Calculate approximate depth based on ship height
-        ship_height = 28  # approximate height of Titanic in meters
-        self.depth = self.sink_pct / 100 * ship_height
-        
-        # Find critical point when ship starts sinking rapidly
-        # This occurs when buoyancy force falls below weight
-        # Standard physics: Sinking accelerates when Fb < Fw
-        self.critical_time = None
-        for i, force in enumerate(self.buoyancy):
-            if force < self.ship_weight:
-                self.critical_time = self.time_pts[i]
-                break
-                
-        # Calculate time to completely sink
-        # Standard condition for complete sinking: Vsub(t) = Vtotal
-        self.sink_time = None
-        for i, pct in enumerate(self.sink_pct):
-            if pct >= 99.9:
-                self.sink_time = self.time_pts[i]
-                break
-        
-        # TILT ANGLE CALCULATION
-        # Not in standard formulas, but related to mass distribution
-        # As water fills compartments, center of mass shifts, creating torque
-        self.tilt_angle = np.zeros_like(self.time_pts)
-        max_tilt = 45  # degrees
-        for i, pct in enumerate(self.sink_pct):
-            if pct < 50:
-                self.tilt_angle[i] = pct / 50 * 15  # Gradual tilt up to 15 degrees
-            else:
-                remaining_pct = pct - 50
-                self.tilt_angle[i] = 15 + (remaining_pct / 50) * (max_tilt - 15)
+        estimate = surrogate.estimate(self.surrogate_table, **params)
+        self.preview = {key: float(value[0]) for key, value in estimate.items()}
+        
+        def fmt(t):
+            return "not reached" if np.isnan(t) else f"≈{t:.1f} min"
+        self.preview_var.set(f"Preview: critical {fmt(self.preview['critical_time'])}, "
+                             f"sinking {fmt(self.preview['sink_time'])}")
 
     def setup_plots(self):
-        self.ax.clear()
-        self.ship_ax.clear()
-        
-        self.ax.set_xlabel("Time (min)")
-        self.ax.set_ylabel("Force (MN)", color='b')
-        self.ax.set_title("Titanic Sinking Simulation")
-        self.ax.grid(True)
-        
-        self.ax.plot(self.time_pts, [self.ship_weight/1e6]*len(self.time_pts),
-                     'r--', label="Ship Weight (MN)")
-        
-        self.ax2 = self.ax.twinx()
-        self.ax2.set_ylabel("Sinking Level (%)", color='g')
-        self.ax2.set_ylim(0, 100)
-        
-        (self.line_buoy,) = self.ax.plot([], [], 'b-', label="Buoyancy Force (MN)")
-        (self.line_sink,) = self.ax2.plot([], [], 'g-', label="Sinking Level (%)")
-        (self.line_tilt,) = self.ax2.plot([], [], 'm--', label="Tilt Angle (°)")
-        
-        self.ax.legend(loc='upper right')
-        self.ax2.legend(loc='upper right', bbox_to_anchor=(1, 0.9))
-        
-        self.ship_ax.set_title("Ship Status")
-        self.ship_ax.set_xlim(0, 10)
-        self.ship_ax.set_ylim(-3, 3)  
-        self.ship_ax.axis('equal')
-        
-        self.water_rect = patches.Rectangle((0, -3), 10, 3, 
-                                           facecolor='lightblue', alpha=0.8)
-        self.ship_ax.add_patch(self.water_rect)
-        
-        self.ship_ax.axhline(y=0, color='blue', linestyle='-', linewidth=1.5)
-        
-        hull_height = 1.2
-        self.ship_rect = patches.Rectangle((2.5, -0.6), 5, hull_height, 
-                                          facecolor='saddlebrown', edgecolor='black')
-        self.ship_ax.add_patch(self.ship_rect)
-        
-        self.compartment_rects = []
-        comp_width = 5 / self.compartments.get()
-        for i in range(self.compartments.get()):
-            rect = patches.Rectangle((2.5 + i * comp_width, -0.6), comp_width, hull_height,
-                                    facecolor='none', edgecolor='black', linestyle=':')
-            self.ship_ax.add_patch(rect)
-            self.compartment_rects.append(rect)
-            
-        self.superstructure = patches.Rectangle((3.5, 0.6), 3, 0.6, 
-                                               facecolor='darkgray', edgecolor='black')
-        self.ship_ax.add_patch(self.superstructure)
-        
-        stack_positions = [4, 5, 6]
-        self.smokestacks = []
-        for pos in stack_positions:
-            stack = patches.Rectangle((pos, 1.2), 0.2, 0.4, 
-                                     facecolor='black', edgecolor='black')
-            self.ship_ax.add_patch(stack)
-            self.smokestacks.append(stack)
-        
-        self.lifeboats = []
-        for i in range(2):
-            lifeboat = patches.Ellipse((3 + i*4, 0.1), 0.5, 0.2, facecolor='brown')
-            self.ship_ax.add_patch(lifeboat)
-            self.lifeboats.append(lifeboat)
-        
-        self.canvas.draw()
-        self.ship_canvas.draw()
+        """Point the persistent scenes at the current run"""
+        self.forces_scene.start(self.result.time_pts, self.result.ship_weight/1e6)
+        self.forces_scene.fit(self.result.time_pts, self.result.buoyancy/1e6, self.result.ship_weight/1e6)
+        self.ship_scene.start(self.run_params['compartments'], self.run_params['breached_compartments'])
+        
+        self.scrub_background = None
+        self.draw_canvas(self.canvas)
+        self.draw_canvas(self.ship_canvas)
+
+    def schedule_scrub(self, *args):
+        # Edits arriving while a re-simulation is pending only change the values it will read
+        if self._scrub_job is None:
+            self._scrub_job = self.master.after(SCRUB_DELAY_MS, self.scrub)
+
+    def scrub(self):
+        """Re-simulate with the current parameters and redraw the forces graph in place.
+
+        Only the engine runs while the edits continue; once they pause for
+        SCRUB_SETTLE_MS, settle_scrub makes the run the current one. The
+        existing line artists get the new data and are
+        blitted over a cached background. The axes are redrawn only when the
+        data leave their limits or shrink well inside them.
+        """
+        self._scrub_job = None
+        if self.is_running:
+            return
+        try:
+            params = self.get_params()
+            engine.validate_params(engine.broadcast_params(**params))
+            if self.breaches is not None and self.breaches.compartment.max() >= params['compartments']:
+                return
+        except (tk.TclError, ValueError):
+            return
+        
+        result = engine.simulate(breaches=self.breaches, forcing=self.forcing, **params)
+        time_pts = result.time_pts
+        buoyancy = result.buoyancy / 1e6
+        weight = result.ship_weight / 1e6
+        self.forces_scene.start(time_pts, weight)
+        self.forces_scene.set_series(time_pts, buoyancy, result.sink_pct, result.tilt_angle)
+        lines = self.forces_scene.lines
+        
+        x_high = time_pts[-1]
+        y_low, y_high = min(buoyancy.min(), weight), max(buoyancy.max(), weight)
+        y_span = y_high - y_low + 1e-9
+        x0, x1 = self.ax.get_xlim()
+        y0, y1 = self.ax.get_ylim()
+        fits = (x0 <= 0 and x_high <= x1 < SCRUB_HEADROOM ** 2 * x_high
+                and y0 <= y_low and y_high <= y1 and y1 - y0 < SCRUB_HEADROOM ** 2 * y_span)
+        
+        if not fits:
+            margin = (SCRUB_HEADROOM - 1) * y_span
+            self.ax.set_xlim(0, SCRUB_HEADROOM * x_high)
+            self.ax.set_ylim(y_low - margin, y_high + margin)
+        
+        if not self.tab_visible(self.canvas):
+            # Forces tab hidden: the artists are current, drawing waits until it is shown
+            self.scrub_background = None
+            self.stale_canvases.add(self.canvas)
+        else:
+            if self.scrub_background is None or not fits:
+                for line in lines:
+                    line.set_visible(False)
+                self.canvas.draw()
+                self.scrub_background = self.canvas.copy_from_bbox(self.fig.bbox)
+                for line in lines:
+                    line.set_visible(True)
+            else:
+                self.canvas.restore_region(self.scrub_background)
+            for line in lines:
+                line.axes.draw_artist(line)
+            self.canvas.blit(self.fig.bbox)
+        
+        status = "Live preview"
+        if result.critical_time is not None:
+            status += f": critical {result.critical_time:.1f} min"
+        if result.sink_time is not None:
+            status += f", sinking {result.sink_time:.1f} min"
+        self.status_var.set(status)
+        
+        self.cancel_settle()
+        self._settle_job = self.master.after(SCRUB_SETTLE_MS, self.settle_scrub, result, params)
+
+    def cancel_settle(self):
+        if self._settle_job is not None:
+            self.master.after_cancel(self._settle_job)
+            self._settle_job = None
+
+    def settle_scrub(self, result, params):
+        """Make the run on the graph the current one, so the results text,
+        Save Results and the exports all describe what is shown"""
+        self._settle_job = None
+        if self.is_running:
+            return
+        self.run_preview = self.preview
+        self.apply_result(result, params)
+        last = len(result) - 1
+        self.ship_scene.start(params['compartments'], params['breached_compartments'])
+        self.ship_scene.update(result.sink_pct[last] / 100, result.tilt_angle[last])
+        self.draw_canvas(self.ship_canvas)
+        self.update_results(last)
+        self.extend_button.config(state=tk.NORMAL)
 
     def update_frame(self):
-        if self.is_paused:
+        if self.is_paused or self.result is None:
             return
             
         i = self.ani_idx
         
-        self.line_buoy.set_data(self.time_pts[:i], self.buoyancy[:i]/1e6)
-        self.line_sink.set_data(self.time_pts[:i], self.sink_pct[:i])
-        self.line_tilt.set_data(self.time_pts[:i], self.tilt_angle[:i])
-        self.canvas.draw()
+        self.forces_scene.set_series(self.result.time_pts[:i], self.result.buoyancy[:i]/1e6,
+                                     self.result.sink_pct[:i], self.result.tilt_angle[:i])
+        self.draw_canvas(self.canvas)
         
         if i > 0:
-            current_sinking = self.sink_pct[i-1] / 100
-            current_tilt = self.tilt_angle[i-1]
-            
-            ship_y_pos = -0.6 - (current_sinking * 1.8)
-            
-            center_x = 5.0  # Center of ship
-            center_y = ship_y_pos + 0.6  # Middle of ship height
-            
-            t = mtransforms.Affine2D().rotate_deg_around(center_x, center_y, current_tilt)
-            
-            self.ship_rect.set_y(ship_y_pos)
-            self.ship_rect.set_transform(t + self.ship_ax.transData)
-            
-            self.superstructure.set_y(ship_y_pos + 1.2)
-            self.superstructure.set_transform(t + self.ship_ax.transData)
-            
-            for stack in self.smokestacks:
-                stack.set_y(ship_y_pos + 1.8)
-                stack.set_transform(t + self.ship_ax.transData)
-                
-            for j, rect in enumerate(self.compartment_rects):
-                rect.set_y(ship_y_pos)
-                rect.set_transform(t + self.ship_ax.transData)
-                
-                if j < self.breached_compartments.get() and current_sinking > 0:
-                    water_height = min(1.2, current_sinking * 2.5)
-                    rect.set_facecolor('lightblue')
-                    rect.set_alpha(0.7)
-                    if water_height > 0:
-                        rect.set_height(water_height)
-            
-            for boat_idx, lifeboat in enumerate(self.lifeboats):
-                if current_sinking > 0.3:
-                    lifeboat_x, _ = lifeboat.center
-                    drift = min(3, current_sinking * 5)
-                    if boat_idx == 0:
-                        lifeboat.center = (lifeboat_x - drift, 0.1) 
-                    else:
-                        lifeboat.center = (lifeboat_x + drift, 0.1) 
-            self.ship_canvas.draw()
-        
-        if i == int(len(self.time_pts) * 0.25) or i == int(len(self.time_pts) * 0.5) or i == int(len(self.time_pts) * 0.75) or i == len(self.time_pts) - 1:
+            self.ship_scene.update(self.result.sink_pct[i-1] / 100, self.result.tilt_angle[i-1])
+            self.draw_canvas(self.ship_canvas)
+        
+        n = len(self.result)
+        if i == int(n * 0.25) or i == int(n * 0.5) or i == int(n * 0.75) or i == n - 1:
             self.update_results(i)
         
         if i < self.max_idx - 1:
@@ -457,6 +563,7 @@ class TitanicSinkingSimulator:
         else:
             self.is_running = False
             self.pause_button.config(state=tk.DISABLED)
+            self.extend_button.config(state=tk.NORMAL)
             self.status_var.set("Simulation complete")
             self.update_results(i)
             
@@ -466,56 +573,87 @@ class TitanicSinkingSimulator:
         self.results_text.config(state=tk.NORMAL)
         self.results_text.delete(1.0, tk.END)
         
-        current_time = self.time_pts[idx]
-        current_sink = self.sink_pct[idx]
-        current_tilt = self.tilt_angle[idx]
+        current_time = self.result.time_pts[idx]
+        current_sink = self.result.sink_pct[idx]
+        current_tilt = self.result.tilt_angle[idx]
         
         results = [
             f"Time: {current_time:.1f} minutes",
             f"Sinking: {current_sink:.1f}%",
             f"Ship Tilt: {current_tilt:.1f}°",
-            f"Buoyancy: {self.buoyancy[idx]/1e6:.1f} MN",
-            f"Weight: {self.ship_weight/1e6:.1f} MN",
-            f"Net Force: {self.net_force[idx]/1e6:.1f} MN"
+            f"Buoyancy: {self.result.buoyancy[idx]/1e6:.1f} MN",
+            f"Weight: {self.result.ship_weight/1e6:.1f} MN",
+            f"Net Force: {self.result.net_force[idx]/1e6:.1f} MN",
+            f"Bending Moment: {self.max_moment[idx]/1e9:.2f} GN·m",
+            f"In Lifeboats: {self.evacuation['in_boats'][idx]}",
+            f"On Boat Deck: {self.evacuation['on_deck'][idx]}",
+            f"Alive: {self.survivors[idx]:.0f}"
         ]
         
-        if self.critical_time is not None:
-            results.append(f"\nCritical point: {self.critical_time:.1f} min")
+        if self.result.critical_time is not None:
+            results.append(f"\nCritical point: {self.result.critical_time:.1f} min")
                 
-        if self.sink_time is not None:
-            results.append(f"Total sinking time: {self.sink_time:.1f} min")
+        if self.result.sink_time is not None:
+            results.append(f"Total sinking time: {self.result.sink_time:.1f} min")
+        
+        if self.break_time is not None:
+            results.append(f"Hull break-up: {self.break_time:.1f} min")
+        
+        if self.run_preview is not None and self.result.sink_time is not None \
+                and not np.isnan(self.run_preview['sink_time']):
+            error = self.run_preview['sink_time'] - self.result.sink_time
+            results.append(f"Preview error: {error:+.1f} min")
+        
+        params = self.run_params
+        key_events = [e for e in self.flood_events
+                      if e.kind in ('critical', 'sunk')
+                      or (e.kind == 'compartment_filled' and e.index == params['breached_compartments'])]
+        if key_events:
+            results.append("\nEvent timeline:")
+            results.extend(events.describe(e) for e in key_events)
         
         self.results_text.insert(tk.END, "\n".join(results))
         self.results_text.config(state=tk.DISABLED)
 
     def show_final_analysis(self):
-        if not hasattr(self, 'sink_time') or self.sink_time is None:
+        # The run being shown, whatever the controls were changed to since
+        params = self.run_params
+        if self.result.sink_time is None:
             analysis = (
                 f"Titanic Sinking Analysis\n\n"
                 f"The ship didn't completely sink during the simulation timeframe.\n"
-                f"Water temperature: {self.temperature.get():.1f}°C\n\n"
+                f"Water temperature: {params['temperature']:.1f}°C\n\n"
                 f"Physical analysis:\n"
-                f"- Maximum water ingress: {max(self.sink_pct):.1f}%\n"
-                f"- Maximum tilt angle: {max(self.tilt_angle):.1f}°\n"
-                f"- Simulation time limit reached: {self.simulation_time.get():.1f} minutes\n\n"
-                f"Consider increasing simulation time or leak rate to see complete sinking."
+                f"- Maximum water ingress: {max(self.result.sink_pct):.1f}%\n"
+                f"- Maximum tilt angle: {max(self.result.tilt_angle):.1f}°\n"
+                f"- Simulation time limit reached: {params['simulation_time']:.1f} minutes\n\n"
+                f"Use Extend Run to continue from where it stopped, or increase the leak rate."
             )
         else:
             analysis = (
                 f"Titanic Sinking Analysis\n\n"
-                f"Total sinking time: {self.sink_time:.1f} minutes\n"
-                f"Water temperature: {self.temperature.get():.1f}°C\n\n"
+                f"Total sinking time: {self.result.sink_time:.1f} minutes\n"
+                f"Water temperature: {params['temperature']:.1f}°C\n\n"
                 f"Physical analysis:\n"
-                f"- Critical buoyancy failure at {self.critical_time:.1f} minutes\n"
-                f"- Maximum tilt angle: {max(self.tilt_angle):.1f}°\n"
-                f"- Water ingress rate: variable, starting at {self.leak_rate.get():.1f} m³/min\n\n"
+                f"- Critical buoyancy failure at {self.result.critical_time:.1f} minutes\n"
+                f"- Maximum tilt angle: {max(self.result.tilt_angle):.1f}°\n"
+                f"- {self.describe_break_up()}\n"
+                f"- People in lifeboats: {self.evacuation['in_boats'][-1]} of {len(self.evacuation['boat'])}\n"
+                f"- Expected survivors at rescue ({survival.RESCUE_TIME:.0f} min): {self.rescued:.0f}\n"
+                f"- Water ingress rate: variable, starting at {params['leak_rate']:.1f} m³/min\n\n"
                 f"Additional factors:\n"
-                f"- Wind speed: {self.wind_speed.get():.1f} m/s\n"
-                f"- Number of breached compartments: {self.breached_compartments.get()} of {self.compartments.get()}\n"
+                f"- Wind speed: {params['wind_speed']:.1f} m/s\n"
+                f"- Number of breached compartments: {params['breached_compartments']} of {params['compartments']}\n"
             )
         
         messagebox.showinfo("Final Analysis", analysis)
 
+    def describe_break_up(self):
+        if self.break_time is None:
+            return "Hull girder held together"
+        return (f"Hull broke in two at {self.break_time:.1f} minutes, "
+                f"{self.break_station:.0f} m from the bow")
+
     def pause_simulation(self):
         if not self.is_running:
             return
@@ -531,7 +669,7 @@ class TitanicSinkingSimulator:
             self.pause_button.config(text="Resume")
 
     def save_results(self):
-        if not hasattr(self, 'time_pts') or len(self.time_pts) == 0:
+        if self.result is None:
             messagebox.showinfo("No Data", "Run a simulation first to generate data.")
             return
             
@@ -557,75 +695,172 @@ class TitanicSinkingSimulator:
                     'Tilt Angle (°)'
                 ])
                 
-                for i in range(len(self.time_pts)):
+                for row in self.result.series:
                     writer.writerow([
-                        self.time_pts[i],
-                        self.buoyancy[i],
-                        self.ship_weight,
-                        self.net_force[i],
-                        self.sink_pct[i],
-                        self.tilt_angle[i]
+                        row['time_pts'],
+                        row['buoyancy'],
+                        self.result.ship_weight,
+                        row['net_force'],
+                        row['sink_pct'],
+                        row['tilt_angle']
                     ])
                     
             self.status_var.set(f"Results saved to {os.path.basename(file_path)}")
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save results: {str(e)}")
 
+    def load_breaches(self):
+        file_path = filedialog.askopenfilename(
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            title="Load Breach Geometry"
+        )
+        
+        if not file_path:
+            return
+            
+        try:
+            self.breaches = breaches.load_breaches(file_path)
+            self.status_var.set(f"Loaded {len(self.breaches)} breaches from {os.path.basename(file_path)}")
+        except (OSError, KeyError, ValueError) as e:
+            messagebox.showerror("Load Error", f"Failed to load breaches: {str(e)}")
+
+    def clear_breaches(self):
+        self.breaches = None
+        self.status_var.set("Breach geometry cleared, using leak rate")
+
+    def load_forcing(self):
+        file_path = filedialog.askopenfilename(
+            filetypes=[("Forcing series", "*.csv *.npy"), ("All files", "*.*")],
+            title="Load Forcing Series"
+        )
+        
+        if not file_path:
+            return
+            
+        try:
+            self.forcing = forcing.load_forcing(file_path)
+            self.status_var.set(f"Loaded {len(self.forcing)} forcing samples "
+                                f"({', '.join(self.forcing.columns)}) from {os.path.basename(file_path)}")
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Load Error", f"Failed to load forcing series: {str(e)}")
+
+    def clear_forcing(self):
+        self.forcing = None
+        self.status_var.set("Forcing series cleared, using constant wind and temperature")
+
     def save_graph(self):
-        if not hasattr(self, 'time_pts') or len(self.time_pts) == 0:
+        if not self.forces_scene.active:
             messagebox.showinfo("No Data", "Run a simulation first to generate data.")
             return
             
         file_path = filedialog.asksaveasfilename(
             defaultextension=".png",
-            filetypes=[("PNG files", "*.png"), ("All files", "*.*")],
+            filetypes=[("PNG files", "*.png"), ("PDF files", "*.pdf"), ("SVG files", "*.svg"), ("All files", "*.*")],
             title="Save Graph Image"
         )
         
         if not file_path:
             return
+        
+        ext = os.path.splitext(file_path)[1].lstrip('.').lower() or 'png'
+        spec = simpledialog.askstring(
+            "Export Formats", "Formats and resolutions, e.g. png@150, png@300, pdf:",
+            initialvalue=ext if ext in export.VECTOR_FORMATS else f"{ext}@{export.DEFAULT_DPI}",
+            parent=self.master)
+        if spec is None:
+            return
+        try:
+            targets = export.parse_targets(spec)
+        except ValueError as e:
+            return messagebox.showerror("Save Error", str(e))
+        
+        # Rendered from a copy of the plot data on a worker thread; the UI and animation keep running
+        future = export.export_graph_async(self.forces_scene.snapshot(), file_path, targets)
+        self.status_var.set(f"Exporting graph to {os.path.basename(file_path)}...")
+        self.watch_export(future)
+
+    def export_animation(self):
+        if self.is_running or self.result is None:
+            messagebox.showinfo("No Data", "Run a simulation to the end first to export its animation.")
+            return
             
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".gif",
+            filetypes=[("Animated GIF", "*.gif"), ("PNG sequence", "*.png"), ("All files", "*.*")],
+            title="Export Animation"
+        )
+        
+        if not file_path:
+            return
+        
+        # Frames are rendered offscreen by worker processes from the finished run
+        future = export.export_animation_async(export.frame_states(self.result), self.run_params['compartments'],
+                                               self.run_params['breached_compartments'], file_path)
+        self.status_var.set(f"Exporting {len(self.result)} frames to {os.path.basename(file_path)}...")
+        self.watch_export(future)
+
+    def watch_export(self, future):
+        if not future.done():
+            self.master.after(EXPORT_POLL_MS, self.watch_export, future)
+            return
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("Save Error", f"Failed to export: {error}")
+            return
+        paths = [os.path.basename(p) for p in future.result()]
+        if len(paths) > 4:
+            self.status_var.set(f"Saved {len(paths)} frames, {paths[0]} to {paths[-1]}")
+        else:
+            self.status_var.set("Saved " + ", ".join(paths))
+
+    def preset_command(self, preset):
+        def load():
+            self.load_preset(preset)
+        return load
+
+    def load_preset(self, preset):
+        """Set the parameters to a scenario of presets.json, defaults for any it leaves out"""
+        params = dict(engine.DEFAULT_PARAMS, **{name: value for name, value in preset.items() if name != 'name'})
+        for name, var in self.get_param_vars().items():
+            var.set(params[name])
+        self.status_var.set(f"{preset['name']} preset loaded")
+
+    def calibrate_historical(self):
+        """Fit leak rate and damaged compartments to the historical critical and sinking times"""
+        params = self.get_params()
+        del params['leak_rate'], params['breached_compartments'], params['simulation_time']
         try:
-            self.fig.savefig(file_path, dpi=300, bbox_inches='tight')
-            self.status_var.set(f"Graph saved to {os.path.basename(file_path)}")
-        except Exception as e:
-            messagebox.showerror("Save Error", f"Failed to save graph: {str(e)}")
-
-    def preset_historical(self):
-        self.ship_mass.set(5.231e7)
-        self.ship_volume.set(66000)
-        self.water_density.set(1025)
-        self.compartments.set(16)
-        self.breached_compartments.set(5)
-        self.leak_rate.set(400)
-        self.simulation_time.set(160)
-        self.temperature.set(-2)
-        self.wind_speed.set(11)
-        self.status_var.set("Historical preset loaded")
-
-    def preset_worst_case(self):
-        self.ship_mass.set(5.231e7)
-        self.ship_volume.set(66000)
-        self.water_density.set(1025)
-        self.compartments.set(16)
-        self.breached_compartments.set(12)
-        self.leak_rate.set(700)
-        self.simulation_time.set(90)
-        self.temperature.set(-4)
-        self.wind_speed.set(25)
-        self.status_var.set("Worst-case preset loaded")
-
-    def preset_best_case(self):
-        self.ship_mass.set(5.231e7)
-        self.ship_volume.set(66000)
-        self.water_density.set(1025)
-        self.compartments.set(16)
-        self.breached_compartments.set(3)
-        self.leak_rate.set(200)
-        self.simulation_time.set(300)
-        self.temperature.set(0)
-        self.wind_speed.set(5)
-        self.status_var.set("Best-case preset loaded")
+            self.status_var.set("Calibrating...")
+            self.master.update_idletasks()
+            fit = calibration.calibrate(free=('leak_rate',), **params)
+        except ValueError as e:
+            return messagebox.showerror("Invalid Input", str(e))
+            
+        targets = calibration.HISTORICAL_TARGETS
+        summary = "\n".join(
+            f"{name.replace('_', ' ').capitalize()}: {fit['times'][name]:.1f} min "
+            f"(target {target:.0f} min, {fit['residuals'][name]:+.0%})"
+            for name, target in targets.items())
+        if not fit['converged']:
+            # The closest the model gets may be far from 1912; only apply it if asked to
+            self.status_var.set("Calibration did not meet the historical targets")
+            if not messagebox.askyesno(
+                    "Calibration",
+                    f"No leak rate and breach count with these ship parameters meets the historical "
+                    f"timeline within {calibration.FIT_TOLERANCE:.0%}. The closest fit "
+                    f"({fit['params']['breached_compartments']} compartments breached, "
+                    f"leak rate {fit['params']['leak_rate']:.1f} m³/min) gives:\n\n{summary}\n\n"
+                    f"Apply it anyway?", default=messagebox.NO):
+                return
+            
+        self.leak_rate.set(round(fit['params']['leak_rate'], 1))
+        self.breached_compartments.set(fit['params']['breached_compartments'])
+        self.simulation_time.set(max(targets.values()) * 1.5)
+        self.status_var.set(
+            f"{'Calibrated' if fit['converged'] else 'Applied closest fit'}: "
+            f"critical {fit['times']['critical_time']:.1f} min ({fit['residuals']['critical_time']:+.0%}), "
+            f"sinking {fit['times']['sink_time']:.1f} min ({fit['residuals']['sink_time']:+.0%}) "
+            f"against {targets['critical_time']:.0f} / {targets['sink_time']:.0f} min")
 
     def show_about(self):
         messagebox.showinfo(
@@ -652,7 +887,14 @@ class TitanicSinkingSimulator:
             "Simulation Settings:\n"
             "- Leak Rate: Rate of water entering the ship (m³/min)\n"
             "- Simulation Time: Duration to simulate (min)\n"
-            "- Animation Speed: Controls playback speed\n\n"
+            "- Animation Speed: Controls playback speed\n"
+            "- Extend Run: Continues a finished run for more minutes from where it stopped\n\n"
+            "Breach Geometry (File menu):\n"
+            "- CSV with compartment, area (m²), discharge_coeff and depth (m) columns\n"
+            "- Replaces the leak rate with Q = CdA√(2gh) per breach\n\n"
+            "Forcing Series (File menu):\n"
+            "- CSV or NPY with time (min) and wind_speed, temperature, sea_state columns\n"
+            "- Replaces the constant wind speed and temperature during the run\n\n"
             "Historical Note: The actual Titanic took approximately 2 hours and 40 minutes to sink "
             "after hitting an iceberg."
         )
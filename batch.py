@@ -0,0 +1,199 @@
+import argparse
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import engine
+import evacuation
+import strength
+import survival
+
+try:
+    import tomllib
+except ModuleNotFoundError:     # Python < 3.11
+    tomllib = None
+
+PRESETS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'presets.json')
+CHUNK_SIZE = 16             # scenarios per worker task, run as one batch
+FORMATS = ('.json', '.toml', '.csv')
+
+
+def _entries(data):
+    """Scenario entries of a parsed JSON or TOML document: a list of tables,
+    a 'scenarios' list, or a table of tables keyed by scenario name"""
+    if isinstance(data, dict) and isinstance(data.get('scenarios'), list):
+        data = data['scenarios']
+    if isinstance(data, list):
+        return [dict(entry) for entry in data]
+    if isinstance(data, dict) and all(isinstance(entry, dict) for entry in data.values()):
+        return [dict(entry, name=name) for name, entry in data.items()]
+    raise ValueError("Expected a list of scenarios or a table of named scenarios")
+
+
+def _number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _read_csv(path):
+    """One scenario per row under a header of 'name' and parameter names;
+    empty cells take the default value"""
+    entries = []
+    with open(path, newline='') as f:
+        reader = csv.DictReader(f)
+        for k, row in enumerate(reader):
+            entry = {}
+            for key, value in row.items():
+                if value in ('', None):
+                    continue
+                try:
+                    entry[key] = value if key == 'name' else _number(value)
+                except ValueError:
+                    name = row.get('name') or f"scenario-{k + 1}"
+                    raise ValueError(f"Scenario {name} (line {reader.line_num}): "
+                                     f"{key} must be a number, not {value!r}") from None
+            entries.append(entry)
+    return entries
+
+
+def load_scenarios(path):
+    """Named scenarios from a JSON, TOML or CSV file.
+
+    Each scenario is a dict with a 'name' and any engine parameters; the
+    ones left out take their defaults. Unnamed scenarios are numbered by
+    position. Every scenario is checked here, so a bad one stops the batch
+    before it starts rather than during the night. Names must be unique,
+    since finished scenarios are recognised by name when a batch resumes.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        entries = _read_csv(path)
+    elif ext == '.json':
+        with open(path) as f:
+            entries = _entries(json.load(f))
+    elif ext == '.toml':
+        if tomllib is None:
+            raise ValueError("TOML scenario files need Python 3.11 or later")
+        with open(path, 'rb') as f:
+            entries = _entries(tomllib.load(f))
+    else:
+        raise ValueError(f"Unsupported scenario file {os.path.basename(path)}, expected {', '.join(FORMATS)}")
+
+    scenarios, names = [], set()
+    for k, entry in enumerate(entries):
+        name = str(entry.pop('name', f"scenario-{k + 1}"))
+        if name in names:
+            raise ValueError(f"Duplicate scenario name: {name}")
+        names.add(name)
+        try:
+            p = engine.broadcast_params(**entry)
+            if len(p['simulation_time']) != 1:
+                raise ValueError("Parameters must be single values")
+            engine.validate_params(p)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Scenario {name}: {e}") from None
+        scenarios.append(dict(entry, name=name))
+    return scenarios
+
+
+def run_scenarios(scenarios, n_points=engine.N_POINTS):
+    """Simulate every scenario in one simulate_batch call.
+
+    scenarios is a list of dicts of engine parameters, missing ones taking
+    their defaults; a 'name' entry is ignored. Returns the full parameters
+    and the SimulationResult of each scenario.
+    """
+    params = [dict(engine.DEFAULT_PARAMS, **{name: value for name, value in s.items() if name != 'name'})
+              for s in scenarios]
+    batch = engine.simulate_batch(n_points=n_points, **{name: [p[name] for p in params]
+                                                        for name in engine.PARAM_NAMES})
+    return params, [engine.scenario(batch, k) for k in range(len(scenarios))]
+
+
+def analyze(result, params):
+    """Event times, hull break-up, evacuation and survival of one run, as the
+    GUI's final analysis reports them; times are None when not reached"""
+    evac = evacuation.evacuate(result, seed=0, compartments=params['compartments'],
+                               ship_volume=params['ship_volume'])
+    rescued = survival.survivors_at_rescue(evac['immersion_time'], result.time_pts, params['temperature'])
+    hull = strength.longitudinal_strength(result, **params)
+    return {
+        'critical_time': result.critical_time,
+        'sink_time': result.sink_time,
+        'break_time': hull['break_time'],
+        'break_station': hull['break_station'],
+        'max_sink_pct': float(np.max(result.sink_pct)),
+        'max_tilt_angle': float(np.max(result.tilt_angle)),
+        'in_boats': int(evac['in_boats'][-1]),
+        'people': len(evac['boat']),
+        'survivors_at_rescue': float(rescued),
+    }
+
+
+def _run_chunk(scenarios, n_points):
+    """JSON lines of a chunk of scenarios, simulated as one batch"""
+    params, results = run_scenarios(scenarios, n_points)
+    return [json.dumps(dict(name=s['name'], params=p, **analyze(result, p)), allow_nan=False)
+            for s, p, result in zip(scenarios, params, results)]
+
+
+def completed(out_path):
+    """Names of the scenarios already in a JSON lines output file.
+
+    A last line cut short by an interruption is removed, so new lines can be
+    appended after it.
+    """
+    if not os.path.exists(out_path):
+        return set()
+    with open(out_path, 'rb+') as f:
+        data = f.read()
+        end = data.rfind(b'\n') + 1
+        if end < len(data):
+            f.truncate(end)
+    return {json.loads(line)['name'] for line in data[:end].splitlines() if line.strip()}
+
+
+def run_file(path, out_path, workers=None, chunk_size=CHUNK_SIZE, n_points=engine.N_POINTS):
+    """Run the scenarios of a file across worker processes, appending one
+    JSON line per scenario to out_path as soon as its chunk finishes.
+
+    Scenarios already in out_path are skipped, so an interrupted batch is
+    continued by running it again. Lines are in completion order; each
+    carries the scenario name, its full parameters and analyze() of the run.
+    Returns the number of scenarios run.
+    """
+    scenarios = load_scenarios(path)
+    done = completed(out_path)
+    todo = [s for s in scenarios if s['name'] not in done]
+    chunks = [todo[start:start + chunk_size] for start in range(0, len(todo), chunk_size)]
+    workers = min(workers or os.cpu_count() or 1, max(len(chunks), 1))
+
+    with open(out_path, 'a') as out:
+        def write(lines):
+            out.write(''.join(line + '\n' for line in lines))
+            out.flush()
+
+        if workers == 1:
+            for chunk in chunks:
+                write(_run_chunk(chunk, n_points))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_run_chunk, chunk, n_points) for chunk in chunks]
+                for future in as_completed(futures):
+                    write(future.result())
+    return len(todo)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a scenario file, streaming results to JSON lines")
+    parser.add_argument('scenarios', help="JSON, TOML or CSV scenario file")
+    parser.add_argument('output', help="JSON lines file; scenarios already in it are skipped")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all CPUs)")
+    args = parser.parse_args()
+    n = run_file(args.scenarios, args.output, workers=args.workers)
+    print(f"Ran {n} scenarios, results in {args.output}")
@@ -0,0 +1,169 @@
+import numpy as np
+
+import breaches
+import engine
+import stability
+import sweep
+
+# Damage pattern: an opening along the starboard bow with the 1912 area, cut
+# short of the 90 m it ran then. Flooding all of 3-90 m exceeds the reserve
+# buoyancy under any subdivision; over 3-72 m a dry forepeak and one bulkhead
+# aft of the damage hold it, but only if their tops stay above the flood
+# level, so spill-over between compartments decides survival
+BREACH_START = 3.0          # m from the bow
+BREACH_END = 72.0           # m from the bow
+BREACH_AREA = 1.2           # m², total
+BREACH_DEPTH = 7.5          # m below the initial waterline
+
+MIN_HEIGHT = stability.DRAFT + 1.0     # m above keel, lowest useful bulkhead top
+MAX_HEIGHT = stability.DEPTH           # m above keel, the bulkhead deck
+
+HORIZON = 600.0             # min, layouts still afloat by then count as surviving it
+TIME_STEP = 1.0             # min
+
+
+def evaluate_layouts(positions, heights, ship_mass=engine.DEFAULT_PARAMS['ship_mass'],
+                     ship_volume=engine.DEFAULT_PARAMS['ship_volume'],
+                     water_density=engine.DEFAULT_PARAMS['water_density'],
+                     breach=(BREACH_START, BREACH_END, BREACH_AREA), horizon=HORIZON, dt=TIME_STEP):
+    """Time until flood water exceeds the reserve buoyancy for a population of hulls.
+
+    positions and heights are (P, B) arrays of bulkhead positions (m from the
+    bow) and top heights (m above keel); NaN positions mark unused slots, so
+    layouts with different bulkhead counts share one batch. Compartment
+    volume is proportional to length. The breach admits Q = Cd·A·√(2gh)
+    (breaches.orifice_inflow) into each compartment it overlaps, with A
+    shared by overlap length, until the water inside reaches the sea level
+    outside. Water above a compartment's aft bulkhead top spills aft through
+    as many compartments as it overtops (engine.spill_over). Layouts still
+    afloat at the horizon get the horizon.
+    """
+    positions = np.asarray(positions, dtype=float)
+    heights = np.asarray(heights, dtype=float)
+    n_pop = len(positions)
+
+    # Sort each layout's bulkheads, unused slots (NaN) go to the stern end
+    order = np.argsort(np.where(np.isnan(positions), np.inf, positions), axis=1)
+    positions = np.take_along_axis(positions, order, axis=1)
+    heights = np.take_along_axis(heights, order, axis=1)
+    used = ~np.isnan(positions)
+    bounds = np.concatenate([np.zeros((n_pop, 1)),
+                             np.where(used, positions, stability.LENGTH),
+                             np.full((n_pop, 1), stability.LENGTH)], axis=1)
+    length = np.diff(bounds, axis=1)                                      # (P, C)
+    volume = np.maximum(ship_volume * length / stability.LENGTH, 1e-9)
+    # Aft bulkhead top of each compartment; the last one has none
+    spill_height = np.concatenate([np.where(used, heights, np.inf), np.full((n_pop, 1), np.inf)], axis=1)
+
+    start, end, area = breach
+    overlap = np.clip(np.minimum(bounds[:, 1:], end) - np.maximum(bounds[:, :-1], start), 0, None)
+    opening = area * overlap / (end - start)                              # m² per compartment
+    spill_volume = np.minimum(volume * spill_height / stability.DEPTH, volume)
+
+    reserve = ship_volume - ship_mass / water_density
+    water = np.zeros_like(volume)
+    admitted = np.zeros(n_pop)
+    sink_time = np.full(n_pop, horizon)
+    afloat = np.ones(n_pop, dtype=bool)
+
+    for step in range(1, int(horizon / dt) + 1):
+        sinkage = water.sum(axis=1, keepdims=True) / ship_volume * engine.SHIP_HEIGHT
+        level = water / volume * stability.DEPTH
+        inflow = breaches.orifice_inflow(breaches.DISCHARGE_COEFF, opening, BREACH_DEPTH, sinkage, level) * dt
+        admitted += inflow.sum(axis=1)
+        water = engine.spill_over(water + inflow, volume, spill_volume)
+
+        lost = afloat & (water.sum(axis=1) > reserve)
+        sink_time[lost] = step * dt
+        afloat &= ~lost
+        if not afloat.any():
+            break
+
+    # Every cubic metre let in is stored somewhere until the hull is full
+    if np.any(np.abs(water.sum(axis=1) - np.minimum(admitted, volume.sum(axis=1))) > 1e-6 * ship_volume):
+        raise RuntimeError("Flood water is not conserved")
+    return sink_time
+
+
+def _evaluate_chunk(settings, chunk):
+    return {'sink_time': evaluate_layouts(chunk['positions'], chunk['heights'], **settings)}
+
+
+def random_layouts(n_layouts, n_bulkheads, max_bulkheads, rng):
+    """Random layouts with n_bulkheads used slots, padded with NaN to max_bulkheads"""
+    positions = np.full((n_layouts, max_bulkheads), np.nan)
+    heights = np.full((n_layouts, max_bulkheads), np.nan)
+    positions[:, :n_bulkheads] = np.sort(rng.uniform(0.02, 0.98, (n_layouts, n_bulkheads)), axis=1) * stability.LENGTH
+    heights[:, :n_bulkheads] = rng.uniform(MIN_HEIGHT, MAX_HEIGHT, (n_layouts, n_bulkheads))
+    return positions, heights
+
+
+def optimize(bulkhead_counts=range(1, 17), population=48, generations=30, mutation=0.05,
+             workers=None, seed=None, **settings):
+    """Evolutionary search for bulkhead positions and heights, per bulkhead count.
+
+    Every generation evaluates the populations of all bulkhead counts together
+    in one batch, split over worker processes. Each population keeps its best
+    quarter and refills with mutated copies (Gaussian steps in position and
+    height) of tournament winners. Returns the best layout found for each
+    count and the Pareto front of time-to-sink against number of bulkheads.
+    """
+    rng = np.random.default_rng(seed)
+    counts = list(bulkhead_counts)
+    max_b = max(counts)
+    pos_parts, height_parts = zip(*(random_layouts(population, k, max_b, rng) for k in counts))
+    positions, heights = np.concatenate(pos_parts), np.concatenate(height_parts)
+    group = np.repeat(np.arange(len(counts)), population)
+    n_elite = max(1, population // 4)
+
+    for generation in range(generations + 1):
+        fitness = sweep.map_chunks(_evaluate_chunk, {'positions': positions, 'heights': heights},
+                                   workers=workers, chunk_size=max(population, 256),
+                                   args=(settings,))['sink_time']
+        if generation == generations:
+            break
+
+        new_pos, new_height = positions.copy(), heights.copy()
+        for g in range(len(counts)):
+            members = np.flatnonzero(group == g)
+            ranked = members[np.argsort(-fitness[members])]
+            children = members[n_elite:]
+            a = rng.choice(members, size=(len(children), 2))
+            parents = np.where(fitness[a[:, 0]] >= fitness[a[:, 1]], a[:, 0], a[:, 1])
+            new_pos[members[:n_elite]] = positions[ranked[:n_elite]]
+            new_height[members[:n_elite]] = heights[ranked[:n_elite]]
+            new_pos[children] = positions[parents] + rng.normal(0, mutation * stability.LENGTH, (len(children), max_b))
+            new_height[children] = heights[parents] + rng.normal(0, mutation * (MAX_HEIGHT - MIN_HEIGHT), (len(children), max_b))
+        positions = np.clip(new_pos, 0.01 * stability.LENGTH, 0.99 * stability.LENGTH)
+        heights = np.clip(new_height, MIN_HEIGHT, MAX_HEIGHT)
+
+    best = []
+    for g, k in enumerate(counts):
+        members = np.flatnonzero(group == g)
+        i = members[np.argmax(fitness[members])]
+        used = ~np.isnan(positions[i])
+        order = np.argsort(positions[i][used])
+        best.append({
+            'bulkheads': k,
+            'sink_time': float(fitness[i]),
+            'positions': positions[i][used][order],
+            'heights': heights[i][used][order],
+        })
+    return {'best': best, 'pareto': pareto_front(best)}
+
+
+def pareto_front(designs):
+    """Designs not beaten by one with fewer (or equal) bulkheads and a longer time to sink"""
+    front = []
+    for design in sorted(designs, key=lambda d: (d['bulkheads'], -d['sink_time'])):
+        if not front or design['sink_time'] > front[-1]['sink_time']:
+            front.append(design)
+    return front
+
+
+if __name__ == "__main__":
+    result = optimize(seed=0)
+    print(f"{'bulkheads':>10}{'time to sink (min)':>20}")
+    for design in result['pareto']:
+        sink_time = f"afloat at {HORIZON:.0f}" if design['sink_time'] >= HORIZON else f"{design['sink_time']:.1f}"
+        print(f"{design['bulkheads']:>10}{sink_time:>20}")
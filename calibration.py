@@ -0,0 +1,101 @@
+import itertools
+
+import numpy as np
+
+import engine
+
+# Historical reference: buoyancy lost around 01:32, foundered at 02:20
+HISTORICAL_TARGETS = {'critical_time': 112.0, 'sink_time': 160.0}
+
+# Largest relative error of an event time for a fit to count as meeting its targets
+FIT_TOLERANCE = 0.1
+
+SEARCH_BOUNDS = {
+    'leak_rate': (50.0, 3000.0),     # m³/min
+    'wind_speed': (0.0, 40.0),       # m/s
+}
+
+
+def calibrate(targets=HISTORICAL_TARGETS, free=('leak_rate', 'wind_speed'), breached=None,
+              bounds=None, grid=7, iterations=14, n_points=601, regularization=1e-3, **params):
+    """Fit leak rate, wind and the number of breached compartments to target event times.
+
+    The continuous parameters in free are found by batched grid refinement:
+    every iteration evaluates a grid x grid box around the current best point
+    for every candidate breach count in ONE simulate_batch call, then halves
+    the box around the new best. The number of breached compartments is
+    chosen as the candidate with the lowest final misfit.
+
+    Misfit is the sum of squared relative errors of the event times plus a
+    small pull of each free parameter towards its starting value. The pull
+    picks a unique answer where the model cannot tell parameters apart (leak
+    rate and wind enter the cascading model only as a product).
+
+    Returns the fitted parameters, the event times they give, their relative
+    errors against the targets (residuals, signed, inf for an event never reached),
+    whether every residual is within FIT_TOLERANCE (converged), the misfit
+    and the number of batched engine calls used.
+    """
+    bounds = dict(SEARCH_BOUNDS, **(bounds or {}))
+    missing = [name for name in free if name not in bounds]
+    if missing:
+        raise ValueError(f"No search bounds for {', '.join(missing)}")
+    base = dict(engine.DEFAULT_PARAMS, **params)
+    horizon = 1.5 * max(targets.values())
+    base['simulation_time'] = horizon
+
+    if breached is None:
+        breached = range(1, int(base['compartments']) + 1)
+    breached = np.asarray(list(breached), dtype=int)
+
+    lo = np.array([bounds[name][0] for name in free])
+    hi = np.array([bounds[name][1] for name in free])
+    span = hi - lo
+    start = np.clip([float(base[name]) for name in free], lo, hi)
+
+    center = np.tile(start, (len(breached), 1))          # (B, P)
+    half = np.tile(span / 2, (len(breached), 1))
+    offsets = np.array(list(itertools.product(np.linspace(-1, 1, grid), repeat=len(free))))  # (G, P)
+
+    def misfit(times, values):
+        err = 0.0
+        for key, target in targets.items():
+            t = np.where(np.isnan(times[key]), 2 * horizon, times[key])
+            err = err + ((t - target) / target) ** 2
+        return err + regularization * (((values - start) / span) ** 2).sum(axis=-1)
+
+    evaluations = 0
+    for _ in range(iterations):
+        values = np.clip(center[:, None, :] + offsets[None, :, :] * half[:, None, :], lo, hi)  # (B, G, P)
+        scenario = {name: values[..., k].ravel() for k, name in enumerate(free)}
+        scenario['breached_compartments'] = np.repeat(breached, len(offsets))
+        run = dict(base, **scenario)
+        batch = engine.simulate_batch(n_points=n_points, **run)
+        evaluations += 1
+
+        err = misfit(engine.event_times(batch), values.reshape(-1, len(free))).reshape(len(breached), len(offsets))
+        best = err.argmin(axis=1)
+        center = values[np.arange(len(breached)), best]
+        half = half / 2
+
+    final = {name: center[:, k] for k, name in enumerate(free)}
+    final['breached_compartments'] = breached
+    batch = engine.simulate_batch(n_points=n_points, **dict(base, **final))
+    evaluations += 1
+    times = engine.event_times(batch)
+    err = misfit(times, center)
+    b = int(err.argmin())
+
+    fitted = {name: float(center[b, k]) for k, name in enumerate(free)}
+    fitted['breached_compartments'] = int(breached[b])
+    fit_times = {key: float(value[b]) for key, value in times.items()}
+    residuals = {key: (fit_times[key] - target) / target if not np.isnan(fit_times[key]) else np.inf
+                 for key, target in targets.items()}
+    return {
+        'params': fitted,
+        'times': fit_times,
+        'residuals': residuals,
+        'converged': max(abs(r) for r in residuals.values()) <= FIT_TOLERANCE,
+        'misfit': float(err[b]),
+        'evaluations': evaluations,
+    }
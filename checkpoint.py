@@ -0,0 +1,67 @@
+import json
+import os
+
+import numpy as np
+
+import engine
+
+SEGMENTS = 10               # checkpoints per run
+
+
+def _jsonable(params):
+    return {name: np.asarray(value).tolist() for name, value in sorted(params.items())}
+
+
+def save_checkpoint(path, result, params):
+    """Write a simulate_batch result and the parameters of its run to path.
+
+    The file is written next to path and moved into place, so an interruption
+    leaves the previous checkpoint intact.
+    """
+    arrays = {key: value for key, value in result.items() if key != 'rng_state'}
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        np.savez(f, params=json.dumps(_jsonable(params)),
+                 rng_state=json.dumps(result.get('rng_state')), **arrays)
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path):
+    """The result and parameters stored by save_checkpoint"""
+    with np.load(path) as data:
+        result = {key: data[key] for key in data.files if key not in ('params', 'rng_state')}
+        params = json.loads(str(data['params']))
+        result['rng_state'] = json.loads(str(data['rng_state']))
+    return result, params
+
+
+def run_checkpointed(path, segments=SEGMENTS, n_points=engine.N_POINTS, breaches=None, forcing=None,
+                     **params):
+    """simulate_batch in segments, saving the result so far to path after each.
+
+    If path already holds a checkpoint of the same parameters, the run resumes
+    after its last finished segment (a finished run is returned as is); a
+    checkpoint of other parameters raises ValueError. Breach geometry and
+    forcing are not stored and must be passed again when resuming. The time
+    grid is the one of a single run with about n_points samples.
+    """
+    end = dict(engine.DEFAULT_PARAMS, **params)['simulation_time']
+    run_params = {name: value for name, value in params.items() if name != 'simulation_time'}
+    step = max((n_points - 1) // segments, 1)
+
+    if os.path.exists(path):
+        result, saved = load_checkpoint(path)
+        if saved != _jsonable(dict(params, simulation_time=end)):
+            raise ValueError(f"Checkpoint {path} was written for different parameters")
+        done = int(np.round(np.max(result['time_pts'][:, -1] / np.asarray(end)) * segments))
+    else:
+        result = engine.simulate_batch(n_points=step + 1, breaches=breaches, forcing=forcing,
+                                       simulation_time=np.asarray(end) / segments, **run_params)
+        save_checkpoint(path, result, dict(params, simulation_time=end))
+        done = 1
+
+    for k in range(done + 1, segments + 1):
+        result = engine.extend(result, np.asarray(end) * k / segments, n_points=step + 1,
+                               breaches=breaches, forcing=forcing, **run_params)
+        save_checkpoint(path, result, dict(params, simulation_time=end))
+    return result
@@ -0,0 +1,601 @@
+import numpy as np
+
+import stability
+
+# Physical constants shared by every model
+G = 9.81                # m/s²
+SHIP_HEIGHT = 28        # approximate height of Titanic in meters
+N_POINTS = 300          # time samples per run, same grid the GUI animates
+
+# Cascading flood model: Q = Q_initial × (1 + k × filled_compartments) × wind_factor
+CASCADE_FACTOR = 0.3
+# Extra inflow per metre of significant wave height (waves washing over the breaches)
+SEA_STATE_FACTOR = 0.05
+# Stochastic bulkhead failure: hazard (per minute) of a bulkhead holding back a
+# compartment's full depth of water; it scales as (head / depth)^exponent. The
+# rate puts the median sinking time of the default scenario at the deterministic one.
+BULKHEAD_HAZARD = 0.2
+BULKHEAD_EXPONENT = 2
+
+DEFAULT_PARAMS = {
+    'ship_mass': 5.231e7,        # kg
+    'ship_volume': 66000,        # m³
+    'water_density': 1025,       # kg/m³
+    'leak_rate': 400,            # m³/min
+    'compartments': 16,          # number of compartments
+    'breached_compartments': 5,  # damaged compartments
+    'simulation_time': 180,      # min
+    'temperature': -2,           # °C
+    'wind_speed': 10,            # m/s
+}
+PARAM_NAMES = tuple(DEFAULT_PARAMS)
+
+
+def broadcast_params(**params):
+    """Fill in defaults and broadcast every parameter to a common 1-D scenario axis"""
+    unknown = set(params) - set(PARAM_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown simulation parameters: {', '.join(sorted(unknown))}")
+    merged = dict(DEFAULT_PARAMS, **params)
+    arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(merged[name], dtype=float))
+                                   for name in PARAM_NAMES))
+    out = {name: np.ravel(arr) for name, arr in zip(PARAM_NAMES, arrays)}
+    out['compartments'] = out['compartments'].astype(int)
+    out['breached_compartments'] = out['breached_compartments'].astype(int)
+    return out
+
+
+def validate_params(p):
+    """Raise ValueError with the same messages the GUI shows for bad input"""
+    for name, key in [
+        ("Ship mass", 'ship_mass'),
+        ("Ship volume", 'ship_volume'),
+        ("Water density", 'water_density'),
+        ("Leak rate", 'leak_rate'),
+        ("Simulation time", 'simulation_time')
+    ]:
+        if np.any(p[key] <= 0):
+            raise ValueError(f"{name} must be greater than 0")
+
+    if np.any(p['compartments'] <= 0):
+        raise ValueError("Number of compartments must be greater than 0")
+
+    if np.any((p['breached_compartments'] <= 0) | (p['breached_compartments'] > p['compartments'])):
+        raise ValueError("Damaged compartments must be between 1 and total compartments")
+
+
+def adjusted_density(water_density, temperature):
+    """Seawater density corrected for temperature (linear around -2 °C)"""
+    temp_factor = 1.0 - 0.000214 * (temperature + 2)
+    return water_density * temp_factor
+
+
+def compartment_water(water_vol, compartment_size, compartments):
+    """Split total flood volume over compartments, filling from the bow aft.
+
+    water_vol has shape (S, n); returns (S, n, max_compartments) where columns
+    beyond a scenario's own compartment count stay zero.
+    """
+    n_max = int(np.max(compartments))
+    j = np.arange(n_max)
+    size = compartment_size[:, None, None]
+    per_comp = np.clip(water_vol[:, :, None] - j * size, 0, size)
+    return np.where(j < compartments[:, None, None], per_comp, 0.0)
+
+
+def simulate_batch(n_points=N_POINTS, breaches=None, forcing=None, start=None,
+                   bulkhead_failure=False, seed=None, cascade_factor=CASCADE_FACTOR, **params):
+    """Run the cascading flood model for many scenarios at once.
+
+    Every keyword in PARAM_NAMES may be a scalar or a 1-D array; arrays are
+    broadcast against each other and each element is one scenario. Returns a
+    dict of arrays shaped (scenarios, n_points), plus critical_time and
+    sink_time shaped (scenarios,) with NaN where the event never happens, and
+    final_water, the water in each compartment at the end (scenarios, compartments).
+
+    start is an optional state from snapshot(); the run then begins at the
+    state's time and water instead of a dry ship at t=0, and simulation_time
+    is the (absolute) time it runs to.
+
+    With a breaches.Breaches geometry the nominal leak rate is replaced by
+    per-breach Bernoulli inflow, see _flood_breaches; the result then also
+    holds comp_water, the water in each compartment at every time step
+    (scenarios, n_points, compartments).
+
+    forcing is an optional forcing.ForcingSeries; its wind_speed, temperature
+    and sea_state columns are interpolated onto the time grid and replace the
+    constant wind and temperature parameters.
+
+    bulkhead_failure replaces the deterministic cascade by random bulkhead
+    collapse, see _flood_stochastic; every scenario is then one realization
+    drawn from a Generator seeded with seed, and the result also holds
+    final_failed and rng_state so the run can be continued exactly.
+
+    cascade_factor is the inflow added per filled compartment (or failed
+    bulkhead); 0 gives a constant inflow.
+    """
+    p = broadcast_params(**params)
+    validate_params(p)
+    n_comp = int(np.max(p['compartments']))
+    if bulkhead_failure and breaches is not None:
+        raise ValueError("Bulkhead failure is modelled for the cascading flood model only")
+    if not bulkhead_failure and start is not None and \
+            (start.get('failed') is not None or start.get('rng_state') is not None):
+        raise ValueError("Start state is from the bulkhead-failure mode, pass bulkhead_failure=True to continue it")
+
+    T = p['simulation_time']
+    failed = np.zeros((len(T), n_comp - 1), dtype=bool)
+    if start is None:
+        t0 = np.zeros_like(T)
+        initial = np.zeros((len(T), n_comp))
+    else:
+        t0, initial, start_failed = _start_state(start, len(T), n_comp)
+        if start_failed is not None:
+            failed = start_failed
+        if np.any(T <= t0):
+            raise ValueError("Simulation time must be later than the start state's time")
+    time_pts = t0[:, None] + np.linspace(0, 1, n_points)[None, :] * (T - t0)[:, None]
+
+    env = environment(p, time_pts, forcing)
+    rho = adjusted_density(p['water_density'][:, None], env['temperature'])
+    compartment_size = p['ship_volume'] / p['compartments']
+
+    if bulkhead_failure:
+        rng = np.random.default_rng(seed)
+        if start is not None and start.get('rng_state') is not None:
+            rng.bit_generator.state = start['rng_state']
+        water_vol, tilt_angle, final_water, failed = _flood_stochastic(
+            p, time_pts, compartment_size, env['inflow_factor'], initial, failed, rng, rho.mean(axis=1),
+            cascade_factor)
+        out = _derive_outputs(p, time_pts, water_vol, rho, compartment_size,
+                              tilt_angle=tilt_angle, final_water=final_water)
+        out['final_failed'] = failed
+        out['rng_state'] = rng.bit_generator.state
+        return out
+
+    if breaches is None:
+        water_vol = _flood_cascade(p, time_pts, compartment_size, env['inflow_factor'], initial.sum(axis=1),
+                                   cascade_factor)
+        comp_water = None
+    else:
+        water_vol, comp_water = _flood_breaches(p, time_pts, compartment_size, breaches,
+                                                env['inflow_factor'], initial)
+
+    return _derive_outputs(p, time_pts, water_vol, rho, compartment_size, comp_water)
+
+
+def simulate_realizations(n_realizations, seed=None, n_points=N_POINTS, **params):
+    """n_realizations runs of the stochastic bulkhead-failure mode for one
+    scalar parameter set, as a simulate_batch result with one row each"""
+    params = {name: np.full(n_realizations, value, dtype=float)
+              for name, value in dict(DEFAULT_PARAMS, **params).items()}
+    return simulate_batch(n_points=n_points, bulkhead_failure=True, seed=seed, **params)
+
+
+def environment(p, time_pts, forcing=None):
+    """Temperature and inflow factor (wind × sea state) on the time grid, shape (S, n)"""
+    shape = time_pts.shape
+    wind_speed = np.broadcast_to(p['wind_speed'][:, None], shape)
+    temperature = np.broadcast_to(p['temperature'][:, None], shape)
+    sea_state = np.zeros(shape)
+    if forcing is not None:
+        series = forcing.interpolate(time_pts)
+        wind_speed = series.get('wind_speed', wind_speed)
+        temperature = series.get('temperature', temperature)
+        sea_state = series.get('sea_state', sea_state)
+
+    wind_factor = 1.0 + (wind_speed / 100)
+    sea_factor = 1.0 + SEA_STATE_FACTOR * sea_state
+    return {'temperature': temperature, 'inflow_factor': wind_factor * sea_factor}
+
+
+def _start_state(start, n_scen, n_comp):
+    """Start time (S,), water per compartment (S, n_comp) and failed bulkheads
+    (S, n_comp - 1, None for deterministic runs) of a snapshot"""
+    t0 = np.broadcast_to(np.atleast_1d(np.asarray(start['time'], dtype=float)), (n_scen,))
+    water = np.atleast_2d(np.asarray(start['comp_water'], dtype=float))
+    water = np.broadcast_to(water, (n_scen, water.shape[1]))
+    if np.any(water[:, n_comp:] > 0):
+        raise ValueError("Start state has water in compartments the ship does not have")
+    initial = np.zeros((n_scen, n_comp))
+    initial[:, :min(n_comp, water.shape[1])] = water[:, :n_comp]
+
+    failed = None
+    if start.get('failed') is not None:
+        state = np.atleast_2d(np.asarray(start['failed'], dtype=bool))
+        state = np.broadcast_to(state, (n_scen, state.shape[1]))
+        failed = np.zeros((n_scen, n_comp - 1), dtype=bool)
+        failed[:, :min(n_comp - 1, state.shape[1])] = state[:, :n_comp - 1]
+    return t0.copy(), initial, failed
+
+
+def _flood_cascade(p, time_pts, compartment_size, inflow_factor, initial, cascade_factor=CASCADE_FACTOR):
+    n_points = time_pts.shape[1]
+
+    # WATER FLOW CALCULATION
+    # Standard formula: Q = CdA√(2gh); our model scales a nominal leak rate
+    # by the share of damaged compartments and lets it grow as they fill
+    initial_leak_rate = p['leak_rate'] * (p['breached_compartments'] / p['compartments'])
+
+    water_vol = np.zeros(time_pts.shape)
+    current_vol = initial
+    water_vol[:, 0] = current_vol
+    dt = (time_pts[:, -1] - time_pts[:, 0]) / (n_points - 1)
+
+    for i in range(1, n_points):
+        # Track how many compartments are filled - drives progressive flooding
+        filled_compartments = np.minimum(p['breached_compartments'], current_vol / compartment_size)
+        current_leak_rate = initial_leak_rate * (1 + cascade_factor * filled_compartments) * inflow_factor[:, i - 1]
+        current_vol = current_vol + current_leak_rate * dt
+        water_vol[:, i] = np.minimum(current_vol, p['ship_volume'])  # Cap at ship volume
+
+    return water_vol
+
+
+def spill_over(comp, capacity, spill_at=None):
+    """Water per compartment (S, C) after overtopped bulkheads have passed
+    their excess aft.
+
+    Water above a compartment's spill volume (its capacity, or less where
+    spill_at marks a lower bulkhead top) runs into the next compartment;
+    the pass goes from bow to stern, so water crosses any number of full
+    compartments in one call. What the last compartment cannot hold backs up
+    forward, filling compartments above their spill volume up to capacity.
+    Total water is conserved until the whole hull is full.
+    """
+    spill_at = capacity if spill_at is None else spill_at
+    if not np.any(comp > spill_at):
+        return comp
+    comp = comp.copy()
+    n_comp = comp.shape[1]
+    for c in range(n_comp - 1):
+        excess = np.maximum(comp[:, c] - spill_at[:, c], 0)
+        comp[:, c] -= excess
+        comp[:, c + 1] += excess
+    for c in range(n_comp - 1, 0, -1):
+        excess = np.maximum(comp[:, c] - capacity[:, c], 0)
+        comp[:, c] -= excess
+        comp[:, c - 1] += excess
+    return np.minimum(comp, capacity)
+
+
+def _flood_breaches(p, time_pts, compartment_size, breaches, inflow_factor, initial):
+    """Per-breach inflow Q = Cd·A·√(2gh) with the head following the ship as it settles.
+
+    Water is tracked per compartment; a full compartment overtops its aft
+    bulkhead and spills into the next one (spill_over), which takes the
+    place of the cascade factor of the nominal model.
+    """
+    n_scen, n_points = time_pts.shape
+    n_comp = int(np.max(p['compartments']))
+    if np.any(breaches.compartment >= np.min(p['compartments'])):
+        raise ValueError("Breach compartment must be less than the number of compartments")
+
+    capacity = np.where(np.arange(n_comp) < p['compartments'][:, None], compartment_size[:, None], 0.0)
+    dt = (time_pts[:, -1] - time_pts[:, 0]) / (n_points - 1)
+
+    comp = initial.copy()
+    comp_water = np.zeros((n_scen, n_points, n_comp))
+    comp_water[:, 0] = comp
+    for i in range(1, n_points):
+        sinkage = comp.sum(axis=1) / p['ship_volume'] * SHIP_HEIGHT
+        comp_level = comp / compartment_size[:, None] * stability.DEPTH
+        q = breaches.inflow_per_compartment(sinkage, comp_level, n_comp) * inflow_factor[:, i - 1, None]
+        comp = comp + q * dt[:, None]
+
+        comp = spill_over(comp, capacity)
+        comp_water[:, i] = comp
+
+    return comp_water.sum(axis=2), comp_water
+
+
+def _flood_stochastic(p, time_pts, compartment_size, inflow_factor, initial, failed, rng, rho_mean,
+                      cascade_factor=CASCADE_FACTOR):
+    """Cascading inflow driven by random bulkhead collapse instead of filled compartments.
+
+    The breached compartments and every compartment behind a failed bulkhead
+    next to them form one flooded zone open to the sea, with a common level;
+    water above the zone's capacity overtops into the compartments aft of it.
+    Each step every bulkhead fails with probability 1 - exp(-λ·dt), where
+    λ = BULKHEAD_HAZARD × (head / depth)^BULKHEAD_EXPONENT and the head is the
+    difference in water level across it. Each failure adds cascade_factor to
+    the inflow multiplier. All realizations and bulkheads draw one
+    (S, compartments - 1) block of uniforms per step, so a seed reproduces a
+    run bit for bit. Returns total water, trim, the final water per
+    compartment and the failed bulkheads.
+    """
+    n_scen, n_points = time_pts.shape
+    n_comp = initial.shape[1]
+    j = np.arange(n_comp)
+    size = compartment_size[:, None]
+    exists = j < p['compartments'][:, None]
+    # Bulkhead k separates compartments k and k+1; those between breached compartments are open anyway
+    breached_zone = j[:-1] < (p['breached_compartments'] - 1)[:, None]
+    real = j[:-1] + 1 < p['compartments'][:, None]
+
+    initial_leak_rate = p['leak_rate'] * (p['breached_compartments'] / p['compartments'])
+    dt = (time_pts[:, -1] - time_pts[:, 0]) / (n_points - 1)
+    failed = failed & real
+
+    def tilt(comp):
+        return stability.trim_angle(comp[:, None, :], p['compartments'], p['ship_mass'],
+                                    p['ship_volume'], rho_mean)[:, 0]
+
+    comp = initial
+    total = comp.sum(axis=1)
+    water_vol = np.zeros(time_pts.shape)
+    tilt_angle = np.zeros(time_pts.shape)
+    water_vol[:, 0] = total
+    tilt_angle[:, 0] = tilt(comp)
+
+    for i in range(1, n_points):
+        zone = 1 + np.cumprod(failed | breached_zone, axis=1).sum(axis=1)
+        current_leak_rate = initial_leak_rate * (1 + cascade_factor * failed.sum(axis=1)) * inflow_factor[:, i - 1]
+        total = np.minimum(total + current_leak_rate * dt, p['ship_volume'])
+
+        in_zone = np.minimum(total, zone * compartment_size)
+        overflow = (total - in_zone)[:, None] - (j - zone[:, None]) * size
+        comp = np.where(j < zone[:, None], (in_zone / zone)[:, None], np.clip(overflow, 0, size))
+        comp = np.where(exists, comp, 0.0)
+
+        level = comp / size
+        head = np.maximum(level[:, :-1] - level[:, 1:], 0)
+        hazard = BULKHEAD_HAZARD * head ** BULKHEAD_EXPONENT
+        failed |= real & (rng.random(failed.shape) < -np.expm1(-hazard * dt[:, None]))
+
+        water_vol[:, i] = total
+        tilt_angle[:, i] = tilt(comp)
+
+    return water_vol, tilt_angle, comp, failed
+
+
+def _derive_outputs(p, time_pts, water_vol, rho, compartment_size, comp_water=None,
+                    tilt_angle=None, final_water=None):
+    ship_volume = p['ship_volume'][:, None]
+
+    # BUOYANCY CALCULATION: Fb = ρ × g × Vsub (Archimedes' principle)
+    displaced_volume = np.maximum(0, ship_volume - water_vol)
+    buoyancy = displaced_volume * rho * G
+
+    # WEIGHT CALCULATION: Fw = m × g
+    ship_weight = p['ship_mass'] * G
+    net_force = buoyancy - ship_weight[:, None]
+
+    # SINKING PERCENTAGE - sinking condition: Vsub(t) ≥ Vtotal
+    sink_pct = np.minimum(water_vol / ship_volume, 1) * 100
+    depth = sink_pct / 100 * SHIP_HEIGHT
+
+    critical_time = first_crossing(time_pts, buoyancy < ship_weight[:, None])
+    sink_time = first_crossing(time_pts, sink_pct >= 99.9)
+
+    # TILT ANGLE CALCULATION from where the flood water actually sits
+    if tilt_angle is None and comp_water is None:
+        # Bow-first fill: trim in closed form from the total, only the last step split per compartment
+        tilt_angle = stability.cascade_trim_angle(
+            water_vol, p['compartments'], p['ship_mass'], p['ship_volume'], rho.mean(axis=1))
+        final_water = compartment_water(water_vol[:, -1:], compartment_size, p['compartments'])[:, 0]
+    elif tilt_angle is None:
+        tilt_angle = stability.trim_angle(
+            comp_water, p['compartments'], p['ship_mass'], p['ship_volume'], rho.mean(axis=1))
+        final_water = comp_water[:, -1]
+
+    out = {
+        'time_pts': time_pts,
+        'water_vol': water_vol,
+        'buoyancy': buoyancy,
+        'ship_weight': ship_weight,
+        'net_force': net_force,
+        'sink_pct': sink_pct,
+        'depth': depth,
+        'tilt_angle': tilt_angle,
+        'critical_time': critical_time,
+        'sink_time': sink_time,
+        'final_water': final_water,
+    }
+    if comp_water is not None:
+        out['comp_water'] = comp_water
+    return out
+
+
+def first_crossing(time_pts, condition):
+    """Time of the first True along the last axis, NaN where it never happens"""
+    hit = condition.any(axis=-1)
+    idx = condition.argmax(axis=-1)
+    t = np.take_along_axis(time_pts, idx[..., None], axis=-1)[..., 0]
+    return np.where(hit, t, np.nan)
+
+
+def crossing_time(time_pts, values, threshold):
+    """First time each row of values rises through threshold, interpolated
+    linearly between samples; NaN where it never does. Smoother than the
+    sample-quantized critical_time/sink_time the engine reports."""
+    above = values >= threshold
+    hit = above.any(axis=-1)
+    idx = np.maximum(above.argmax(axis=-1), 1)
+
+    def take(a, k):
+        return np.take_along_axis(a, (idx + k)[..., None], axis=-1)[..., 0]
+
+    v0, v1 = take(values, -1), take(values, 0)
+    t0, t1 = take(time_pts, -1), take(time_pts, 0)
+    frac = np.clip((threshold - v0) / np.where(v1 > v0, v1 - v0, 1), 0, 1)
+    t = np.where(above[..., 0], time_pts[..., 0], t0 + frac * (t1 - t0))
+    return np.where(hit, t, np.nan)
+
+
+def event_times(batch):
+    """Interpolated critical_time and sink_time of a simulate_batch result"""
+    return {
+        'critical_time': crossing_time(batch['time_pts'], -batch['net_force'], 0.0),
+        'sink_time': crossing_time(batch['time_pts'], batch['sink_pct'], 99.9),
+    }
+
+
+def simulate(n_points=N_POINTS, breaches=None, forcing=None, start=None, **params):
+    """Single-scenario convenience wrapper around simulate_batch.
+
+    Returns a SimulationResult: 1-D series and critical_time/sink_time as
+    float or None.
+    """
+    batch = simulate_batch(n_points=n_points, breaches=breaches, forcing=forcing, start=start, **params)
+    if len(batch['time_pts']) != 1:
+        raise ValueError("simulate() takes scalar parameters, use simulate_batch() for sweeps")
+    return scenario(batch, 0)
+
+
+def scenario(batch, k):
+    """Scenario k of a simulate_batch result as a SimulationResult"""
+    return SimulationResult.from_arrays(**{key: value if key == 'rng_state' else value[k]
+                                          for key, value in batch.items()})
+
+
+# Outputs with one value per time sample, joined end to end by extend()
+SERIES_KEYS = ('time_pts', 'water_vol', 'buoyancy', 'net_force', 'sink_pct', 'depth', 'tilt_angle')
+SERIES_DTYPE = np.dtype([(key, float) for key in SERIES_KEYS])
+
+
+class SimulationResult:
+    """One run, read-only: every time series in one structured array.
+
+    series holds a record per time sample with the SERIES_KEYS fields; each
+    column (result.time_pts, result.sink_pct...) is a view into it, not a
+    copy. ship_weight is in N, critical_time and sink_time in minutes or
+    None, and final_water, final_failed and rng_state are the end state that
+    snapshot() and extend() continue from. Breach-geometry runs also keep
+    comp_water, the water in each compartment at every sample (n, C). It can also be read like the dict
+    simulate() used to return: result['sink_pct'], result.get('rng_state'),
+    keys() and items().
+    """
+
+    __slots__ = ('series', 'ship_weight', 'critical_time', 'sink_time', 'final_water', 'final_failed', 'rng_state',
+                 'comp_water')
+    # Outputs that only some flood models have
+    OPTIONAL = ('final_failed', 'rng_state', 'comp_water')
+
+    def __init__(self, series, ship_weight, critical_time=None, sink_time=None, final_water=None,
+                 final_failed=None, rng_state=None, comp_water=None):
+        series.flags.writeable = False
+        for array in (final_water, final_failed, comp_water):
+            if array is not None:
+                array.flags.writeable = False
+        values = (series, ship_weight, critical_time, sink_time, final_water, final_failed, rng_state, comp_water)
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_arrays(cls, ship_weight, critical_time, sink_time, final_water=None, final_failed=None,
+                    rng_state=None, comp_water=None, **series):
+        """Pack separate 1-D series (keyed by SERIES_KEYS) into one record array.
+
+        Event times may be NaN for never; they are stored as None.
+        """
+        data = np.empty(len(series['time_pts']), dtype=SERIES_DTYPE)
+        for key in SERIES_KEYS:
+            data[key] = series[key]
+        times = [None if value is None or np.isnan(value) else float(value) for value in (critical_time, sink_time)]
+        return cls(data, float(ship_weight), *times,
+                   final_water=None if final_water is None else np.array(final_water, dtype=float),
+                   final_failed=None if final_failed is None else np.array(final_failed, dtype=bool),
+                   rng_state=rng_state,
+                   comp_water=None if comp_water is None else np.array(comp_water, dtype=float))
+
+    def __getattr__(self, name):
+        # Only reached for names that are not slots
+        if name in SERIES_KEYS:
+            return self.series[name]
+        raise AttributeError(f"'SimulationResult' object has no attribute '{name}'")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SimulationResult is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("SimulationResult is read-only")
+
+    def __reduce__(self):
+        return type(self), tuple(object.__getattribute__(self, name) for name in self.__slots__)
+
+    def __len__(self):
+        return len(self.series)
+
+    def __repr__(self):
+        return (f"SimulationResult(n_points={len(self)}, critical_time={self.critical_time}, "
+                f"sink_time={self.sink_time})")
+
+    def keys(self):
+        return SERIES_KEYS + tuple(name for name in self.__slots__[1:]
+                                   if name not in self.OPTIONAL or getattr(self, name) is not None)
+
+    def __getitem__(self, key):
+        if key in SERIES_KEYS:
+            return self.series[key]
+        if key in self.__slots__[1:] and key in self.keys():
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+
+def snapshot(result):
+    """Engine state at the end of a simulate or simulate_batch result.
+
+    A dict with the end time, the water in every compartment (which fixes the
+    filled-compartment count of the cascading model and the spill state of
+    breach geometry), and the failed bulkheads and random generator state of
+    the bulkhead-failure mode (None for the deterministic models). Pass it as
+    start= to continue.
+    """
+    return {
+        'time': np.asarray(result['time_pts'])[..., -1],
+        'comp_water': np.asarray(result['final_water']),
+        'failed': result.get('final_failed'),
+        'rng_state': result.get('rng_state'),
+    }
+
+
+def extend(result, simulation_time, n_points=None, breaches=None, forcing=None, bulkhead_failure=None,
+           **params):
+    """Continue a run from its last state to a later simulation_time.
+
+    params must be those of the original run (simulation_time apart). The
+    extension keeps the original time step unless n_points is given, and the
+    result is the original joined to the extension, as if the run had been
+    that long from the start. Works on simulate (single scenario) and
+    simulate_batch results alike. The bulkhead-failure mode follows from the
+    result, which carries its random state; an explicit bulkhead_failure
+    that contradicts it is an error.
+    """
+    state = snapshot(result)
+    stochastic = state['failed'] is not None or state['rng_state'] is not None
+    if bulkhead_failure is None:
+        bulkhead_failure = stochastic
+    elif bool(bulkhead_failure) != stochastic:
+        raise ValueError("bulkhead_failure must match the run being extended")
+
+    single = np.ndim(result['time_pts']) == 1
+    time_pts = np.atleast_2d(result['time_pts'])
+    if n_points is None:
+        dt = time_pts[:, 1] - time_pts[:, 0]
+        n_points = int(np.ceil(np.max((simulation_time - time_pts[:, -1]) / dt) - 1e-9)) + 1
+
+    run = simulate if single else simulate_batch
+    ext = run(n_points=n_points, breaches=breaches, forcing=forcing, start=state,
+              bulkhead_failure=bulkhead_failure, simulation_time=simulation_time, **params)
+
+    out = dict(ext)
+    for key in SERIES_KEYS:
+        out[key] = np.concatenate([result[key], ext[key][..., 1:]], axis=-1)
+    if 'comp_water' in ext:
+        out['comp_water'] = np.concatenate([result['comp_water'], ext['comp_water'][..., 1:, :]], axis=-2)
+    for key in ('critical_time', 'sink_time'):
+        if single:
+            out[key] = result[key] if result[key] is not None else ext[key]
+        else:
+            out[key] = np.where(np.isnan(result[key]), ext[key], result[key])
+    return SimulationResult.from_arrays(**out) if single else out
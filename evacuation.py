@@ -0,0 +1,213 @@
+import numpy as np
+
+import calibration
+import engine
+import stability
+
+# Deck heights above the keel (m), boat deck first
+DECK_NAMES = ('Boat', 'A', 'B', 'C', 'D', 'E', 'F', 'G')
+DECK_HEIGHTS = np.array([29.5, 26.7, 23.7, 20.9, 17.8, 15.0, 12.2, 9.4])
+STAIRWAYS = np.array([60.0, 100.0, 190.0])  # m from the bow: forward, grand and aft staircases
+
+WALK_SPEED = 40.0           # m/min along corridors, crowded
+CLIMB_TIME = 1.5            # min per deck on crowded stairs
+MAX_WALK_TILT = 20.0        # degrees of trim at which people can no longer move along the deck
+
+# Passengers and crew on board, 15 April 1912, by class (0 = crew)
+COMPLEMENT = {0: 908, 1: 324, 2: 284, 3: 708}
+# Decks each class was berthed on (indices into DECK_NAMES)
+CLASS_DECKS = {0: (4, 5, 6, 7), 1: (1, 2, 3, 4), 2: (4, 5, 6), 3: (5, 6, 7)}
+# Delay before people start for the boat deck, uniform range in minutes
+ALERT_DELAY = {0: (5, 15), 1: (15, 35), 2: (20, 40), 3: (30, 60)}
+# Share of women and children, who were loaded first
+PRIORITY_SHARE = {0: 0.01, 1: 0.45, 2: 0.45, 3: 0.35}
+THIRD_CLASS_GATE_DELAY = 20.0   # min, barriers between steerage and the boat deck
+
+
+class Passengers:
+    """Everyone on board as column arrays: class, deck, location and priority"""
+
+    def __init__(self, pclass, deck, x, alert_delay, priority):
+        self.pclass = np.asarray(pclass, dtype=int)
+        self.deck = np.asarray(deck, dtype=int)
+        self.x = np.asarray(x, dtype=float)
+        self.alert_delay = np.asarray(alert_delay, dtype=float)
+        self.priority = np.asarray(priority, dtype=bool)
+
+    def __len__(self):
+        return len(self.pclass)
+
+    @classmethod
+    def generate(cls, seed=None, complement=COMPLEMENT):
+        """Random but reproducible population with the historical class mix"""
+        rng = np.random.default_rng(seed)
+        pclass = np.concatenate([np.full(n, c) for c, n in complement.items()])
+        deck = np.empty_like(pclass)
+        delay = np.empty(len(pclass))
+        priority = np.empty(len(pclass), dtype=bool)
+        for c in complement:
+            sel = pclass == c
+            deck[sel] = rng.choice(CLASS_DECKS[c], size=sel.sum())
+            delay[sel] = rng.uniform(*ALERT_DELAY[c], size=sel.sum())
+            priority[sel] = rng.random(sel.sum()) < PRIORITY_SHARE[c]
+        x = rng.uniform(0.1, 0.9, size=len(pclass)) * stability.LENGTH
+        return cls(pclass, deck, x, delay, priority)
+
+
+class Lifeboats:
+    """The lifeboats as column arrays: capacity, scheduled launch time, position
+    and the share of seats actually filled when the boat is lowered"""
+
+    def __init__(self, capacity, launch_time, x, load_factor=1.0):
+        self.capacity = np.asarray(capacity, dtype=int)
+        self.launch_time = np.asarray(launch_time, dtype=float)
+        self.x = np.asarray(x, dtype=float)
+        self.load_factor = np.broadcast_to(np.asarray(load_factor, dtype=float), self.capacity.shape)
+
+    def __len__(self):
+        return len(self.capacity)
+
+    @classmethod
+    def historical(cls, time_scale=1.0):
+        """14 standard boats, 2 emergency cutters and 4 collapsibles, launched
+        from 00:45 to 02:05 (minutes after the collision at 23:40). time_scale
+        stretches the schedule for runs that sink faster or slower than 160 min.
+        The first boats left half empty; loading improved as the danger became
+        obvious.
+        """
+        capacity = [65] * 14 + [40] * 2 + [47] * 4
+        launch = [65, 73, 75, 80, 85, 90, 95, 95, 100, 105, 110, 115, 120, 125,
+                  85, 90, 120, 125, 145, 150]
+        x = [45, 55, 65, 75, 85, 95, 105, 165, 175, 185, 195, 205, 215, 225,
+             40, 50, 42, 52, 35, 60]
+        load_factor = np.interp(launch, [65, 150], [0.45, 0.95])
+        return cls(capacity, np.array(launch) * time_scale, x, load_factor)
+
+    @classmethod
+    def for_run(cls, result):
+        """historical() with the schedule scaled to the run's flooding: by its
+        sink time against the 160 min of 1912, or by its critical time if it
+        does not sink within the run; unscaled if neither is reached"""
+        for key in ('sink_time', 'critical_time'):
+            if result[key] is not None:
+                return cls.historical(result[key] / calibration.HISTORICAL_TARGETS[key])
+        return cls.historical()
+
+
+def outside_waterline(result, x):
+    """Height of the sea above the keel at hull positions x for every time step, (n, len(x))"""
+    slope = np.tan(np.radians(result['tilt_angle']))[:, None]
+    return stability.DRAFT + result['depth'][:, None] + (stability.LENGTH / 2 - x)[None, :] * slope
+
+
+def inside_waterline(result, x, compartments, ship_volume=engine.DEFAULT_PARAMS['ship_volume']):
+    """Height of the flood water above the keel at hull positions x inside the
+    hull for every time step, (n, len(x)).
+
+    Each compartment's level rises to the bulkhead deck as it fills, with
+    the water the run computed per compartment (breach geometry) or, for the
+    cascading model, its total filling the compartments from the bow aft as
+    engine.compartment_water splits it. Where the sea outside rises over the
+    bulkhead deck it floods the decks above as well.
+    """
+    comp = np.minimum((x / (stability.LENGTH / compartments)).astype(int), compartments - 1)
+    if result.get('comp_water') is not None:
+        fill = np.clip(result['comp_water'][:, comp] / (ship_volume / compartments), 0, 1)
+    else:
+        fill = np.clip(result['sink_pct'][:, None] / 100 * compartments - comp[None, :], 0, 1)
+    outside = outside_waterline(result, x)
+    return np.maximum(fill * stability.DEPTH, np.where(outside >= stability.DEPTH, outside, 0))
+
+
+def evacuate(result, passengers=None, lifeboats=None, seed=None,
+             compartments=engine.DEFAULT_PARAMS['compartments'], ship_volume=engine.DEFAULT_PARAMS['ship_volume']):
+    """Move everyone towards the boats along the flooding timeline of one run.
+
+    result is what engine.simulate() returns, compartments and ship_volume
+    those of the run. Each step every agent that has been alerted walks to
+    the nearest staircase and climbs to the boat deck, slowed by the trim;
+    agents whose deck the flood water inside the hull reaches first are
+    immersed. The boats are launched on the 1912 schedule scaled to the
+    run (Lifeboats.for_run) unless others are given. At each boat's launch
+    time the waiting agents are loaded, women and children and higher
+    classes first, until its seats are taken. A boat whose davit is already
+    under water is lost.
+
+    Returns per-agent arrays (boat, boarded_time, immersion_time with NaN when
+    not immersed within the run) and per-step counts (in_boats, on_deck,
+    aboard).
+    """
+    rng = np.random.default_rng(seed)
+    passengers = passengers if passengers is not None else Passengers.generate(rng)
+    lifeboats = lifeboats if lifeboats is not None else Lifeboats.for_run(result)
+
+    time_pts = result['time_pts']
+    n_steps, n_agents = len(time_pts), len(passengers)
+
+    stair = np.abs(passengers.x[:, None] - STAIRWAYS[None, :]).min(axis=1)
+    route = stair / WALK_SPEED + passengers.deck * CLIMB_TIME      # minutes at full speed
+    start = passengers.alert_delay + np.where(passengers.pclass == 3, THIRD_CLASS_GATE_DELAY, 0)
+    height = DECK_HEIGHTS[passengers.deck]
+
+    # Loading order: women and children, then class, then chance
+    rank = np.where(passengers.pclass == 0, 4, passengers.pclass)
+    order_key = (~passengers.priority) * 10 + rank + rng.random(n_agents)
+
+    waterline_agents = inside_waterline(result, passengers.x, int(compartments), ship_volume)
+    waterline_boats = outside_waterline(result, lifeboats.x)
+    waterline_boat_deck = outside_waterline(result, passengers.x)
+    speed = np.clip(1 - result['tilt_angle'] / MAX_WALK_TILT, 0, 1)
+
+    progress = np.zeros(n_agents)           # minutes of route covered
+    on_deck = np.zeros(n_agents, dtype=bool)
+    boat = np.full(n_agents, -1)
+    boarded_time = np.full(n_agents, np.nan)
+    immersion_time = np.full(n_agents, np.nan)
+    launched = np.zeros(len(lifeboats), dtype=bool)
+
+    in_boats = np.zeros(n_steps, dtype=int)
+    waiting = np.zeros(n_steps, dtype=int)
+    aboard = np.zeros(n_steps, dtype=int)
+
+    for i in range(1, n_steps):
+        t, dt = time_pts[i], time_pts[i] - time_pts[i - 1]
+        active = (boat < 0) & np.isnan(immersion_time)
+
+        moving = active & ~on_deck & (t >= start)
+        progress += np.where(moving, speed[i - 1] * dt, 0)
+        on_deck |= moving & (progress >= route)
+
+        # Flood water reaches people still below, the sea those on the boat deck where it goes under
+        flooded = active & np.where(on_deck, waterline_boat_deck[i] >= DECK_HEIGHTS[0],
+                                    waterline_agents[i] >= height)
+        immersion_time[flooded] = t
+
+        # Boats due this step load the best-placed waiting agents and leave
+        due = ~launched & (lifeboats.launch_time <= t)
+        for b in np.flatnonzero(due):
+            launched[b] = True
+            if waterline_boats[i, b] >= DECK_HEIGHTS[0]:
+                continue
+            candidates = np.flatnonzero(on_deck & (boat < 0) & np.isnan(immersion_time))
+            seats = int(lifeboats.capacity[b] * lifeboats.load_factor[b])
+            chosen = candidates[np.argsort(order_key[candidates])[:seats]]
+            boat[chosen] = b
+            boarded_time[chosen] = t
+
+        in_boats[i] = np.count_nonzero(boat >= 0)
+        waiting[i] = np.count_nonzero(on_deck & (boat < 0) & np.isnan(immersion_time))
+        aboard[i] = n_agents - in_boats[i] - np.count_nonzero(~np.isnan(immersion_time))
+
+    # Whoever is still on board when the ship goes down ends up in the water
+    if result['sink_time'] is not None:
+        left = (boat < 0) & np.isnan(immersion_time)
+        immersion_time[left] = result['sink_time']
+
+    return {
+        'boat': boat,
+        'boarded_time': boarded_time,
+        'immersion_time': immersion_time,
+        'in_boats': in_boats,
+        'on_deck': waiting,
+        'aboard': aboard,
+    }
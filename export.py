@@ -0,0 +1,199 @@
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import scene
+
+FIGSIZE = (6, 4)            # inches, as on screen
+DEFAULT_DPI = 300
+VECTOR_FORMATS = ('pdf', 'svg', 'eps', 'ps')
+FRAME_FIGSIZE = (12, 4)     # forces graph and ship side by side
+FRAME_DPI = 80
+GIF_FPS = 20
+
+_executor = None
+
+
+def parse_targets(text):
+    """Export targets from text such as "png@150, png@300, pdf".
+
+    Returns (format, dpi) pairs; raster formats without a DPI get
+    DEFAULT_DPI, vector formats get None.
+    """
+    supported = FigureCanvasAgg.get_supported_filetypes()
+    targets = []
+    for item in text.replace(';', ',').split(','):
+        item = item.strip().lower()
+        if not item:
+            continue
+        fmt, _, dpi = item.partition('@')
+        fmt = fmt.lstrip('.')
+        if fmt not in supported:
+            raise ValueError(f"Unsupported export format: {fmt}")
+        if fmt in VECTOR_FORMATS:
+            targets.append((fmt, None))
+        else:
+            targets.append((fmt, int(dpi) if dpi else DEFAULT_DPI))
+    if not targets:
+        raise ValueError("No export format given")
+    return list(dict.fromkeys(targets))
+
+
+def render_forces(snapshot, figsize=FIGSIZE):
+    """A new offscreen Agg figure showing a ForcesScene snapshot.
+
+    Uses matplotlib.figure.Figure directly rather than pyplot, so it shares no
+    state with the GUI figures and can be drawn from any thread.
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    forces = scene.ForcesScene(fig.add_subplot())
+    forces.restore(snapshot)
+    return fig
+
+
+def export_graph(snapshot, path, targets=(('png', DEFAULT_DPI),)):
+    """Render a ForcesScene snapshot once and save it in every (format, dpi)
+    of targets. Files are named after path with the format's extension; a
+    format requested at several DPIs gets the DPI in the name. Returns the
+    paths written."""
+    root = os.path.splitext(path)[0]
+    fig = render_forces(snapshot)
+    counts = {}
+    for fmt, _ in targets:
+        counts[fmt] = counts.get(fmt, 0) + 1
+
+    written = []
+    for fmt, dpi in targets:
+        name = f"{root}_{dpi}dpi.{fmt}" if counts[fmt] > 1 else f"{root}.{fmt}"
+        fig.savefig(name, format=fmt, dpi=dpi or DEFAULT_DPI, bbox_inches='tight')
+        written.append(name)
+    return written
+
+
+def export_graph_async(snapshot, path, targets):
+    """export_graph on a background thread; returns a concurrent.futures.Future
+    of the paths written. Exports run one at a time in request order."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='graph-export')
+    return _executor.submit(export_graph, snapshot, path, targets)
+
+
+def frame_states(result):
+    """What each animation frame shows, from an engine result, in the GUI's units"""
+    return {
+        'time_pts': np.asarray(result['time_pts'], dtype=float),
+        'buoyancy': np.asarray(result['buoyancy'], dtype=float) / 1e6,
+        'sink_pct': np.asarray(result['sink_pct'], dtype=float),
+        'tilt_angle': np.asarray(result['tilt_angle'], dtype=float),
+        'ship_weight': float(result['ship_weight']) / 1e6,
+    }
+
+
+def _render_frames(states, compartments, breached, frames, names, dpi, figsize):
+    """Draw and save frames (consecutive indices) of the GUI animation.
+
+    Frame i shows the forces graph up to sample i and the ship at sample
+    i - 1, as update_frame does. Axis limits are fixed for the whole run, so
+    axes, ticks and water are drawn once and each frame only draws the
+    moving artists over that background. Lifeboats drift from frame to
+    frame, so the ship is first stepped through the earlier frames.
+    """
+    from PIL import Image
+
+    time_pts, buoyancy = states['time_pts'], states['buoyancy']
+    sink_pct, tilt_angle = states['sink_pct'], states['tilt_angle']
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    forces_ax, ship_ax = fig.subplots(1, 2)
+    forces = scene.ForcesScene(forces_ax)
+    ship = scene.ShipScene(ship_ax)
+    forces.start(time_pts, states['ship_weight'])
+    forces.fit(time_pts, buoyancy, states['ship_weight'])
+    ship.start(compartments, breached)
+    fig.subplots_adjust(left=0.07, right=0.93, bottom=0.12, wspace=0.3)
+
+    # In the order a full draw paints them
+    children = ship_ax.get_children()
+    ship_moving = [ship.hull, ship.superstructure, ship.waterline] + ship.smokestacks + ship.lifeboats \
+        + ship.compartments[:compartments]
+    moving = [forces.buoyancy, forces.legends[0], forces.sink, forces.tilt, forces.legends[1]] \
+        + sorted(ship_moving, key=lambda artist: (artist.get_zorder(), children.index(artist)))
+    for artist in moving:
+        artist.set_visible(False)
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+    for artist in moving:
+        artist.set_visible(True)
+
+    for i in range(1, frames[0]):
+        ship.update(sink_pct[i-1] / 100, tilt_angle[i-1])
+    for i, name in zip(frames, names):
+        forces.set_series(time_pts[:i], buoyancy[:i], sink_pct[:i], tilt_angle[:i])
+        if i > 0:
+            ship.update(sink_pct[i-1] / 100, tilt_angle[i-1])
+        canvas.restore_region(background)
+        for artist in moving:
+            artist.axes.draw_artist(artist)
+        Image.fromarray(np.asarray(canvas.buffer_rgba())).save(name)
+    return len(frames)
+
+
+def export_animation(states, compartments, breached, path, workers=None, fps=GIF_FPS,
+                     dpi=FRAME_DPI, figsize=FRAME_FIGSIZE):
+    """Render every frame of a run's animation offscreen across worker processes.
+
+    states is frame_states() of the run. A path ending in .gif gives one
+    animated GIF at fps frames per second; any other path gives a PNG
+    sequence named after it, e.g. run.png -> run_0000.png, run_0001.png...
+    Each worker draws one contiguous range of frames on its own Agg figure.
+    Returns the paths written.
+    """
+    n_frames = len(states['time_pts'])
+    root, ext = os.path.splitext(path)
+    gif = ext.lower() == '.gif'
+    directory = tempfile.mkdtemp(prefix='frames-') if gif else None
+    if gif:
+        names = [os.path.join(directory, f"{i:04d}.png") for i in range(n_frames)]
+    else:
+        names = [f"{root}_{i:04d}.png" for i in range(n_frames)]
+
+    workers = min(workers or os.cpu_count() or 1, n_frames)
+    ranges = [r for r in np.array_split(np.arange(n_frames), workers) if len(r)]
+    args = [(states, compartments, breached, list(r), names[r[0]:r[-1] + 1], dpi, figsize) for r in ranges]
+    try:
+        if len(ranges) == 1:
+            _render_frames(*args[0])
+        else:
+            with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+                list(pool.map(_render_frames, *zip(*args)))
+        if not gif:
+            return names
+        _write_gif(names, path, fps)
+        return [path]
+    finally:
+        if gif:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def _write_gif(names, path, fps):
+    from PIL import Image
+
+    frames = [Image.open(name).convert('RGB').quantize(method=Image.Quantize.FASTOCTREE) for name in names]
+    frames[0].save(path, save_all=True, append_images=frames[1:],
+                   duration=round(1000 / fps), loop=0)
+
+
+def export_animation_async(states, compartments, breached, path, workers=None):
+    """export_animation started from a background thread; returns a Future of the paths written"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='graph-export')
+    return _executor.submit(export_animation, states, compartments, breached, path, workers)
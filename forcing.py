@@ -0,0 +1,122 @@
+import csv
+import os
+
+import numpy as np
+
+FORCING_COLUMNS = ('wind_speed', 'temperature', 'sea_state')
+CHUNK_ROWS = 65536          # rows read or converted at a time
+CHUNK_POINTS = 65536        # grid points interpolated at a time
+
+
+class ForcingSeries:
+    """Time series of environmental forcing backed by a memory-mapped .npy file.
+
+    The file holds a structured array with a 'time' field in minutes since the
+    collision and any of the FORCING_COLUMNS: wind_speed (m/s), temperature
+    (°C) and sea_state (significant wave height, m). Only the rows around the
+    requested times are ever read, so series far larger than memory can be
+    replayed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.data = np.load(path, mmap_mode='r')
+        names = self.data.dtype.names or ()
+        if 'time' not in names:
+            raise ValueError(f"Forcing file {os.path.basename(path)} has no 'time' column")
+        self.columns = tuple(name for name in FORCING_COLUMNS if name in names)
+        if not self.columns:
+            raise ValueError(f"Forcing file {os.path.basename(path)} has none of {', '.join(FORCING_COLUMNS)}")
+        if len(self.data) < 2:
+            raise ValueError("Forcing series needs at least two samples")
+
+        # Check the time column is increasing without loading it whole
+        last = -np.inf
+        for start in range(0, len(self.data), CHUNK_ROWS):
+            t = np.asarray(self.data['time'][start:start + CHUNK_ROWS])
+            if t[0] <= last or np.any(np.diff(t) <= 0):
+                raise ValueError("Forcing time column must be strictly increasing")
+            last = t[-1]
+
+    def __len__(self):
+        return len(self.data)
+
+    @property
+    def duration(self):
+        return float(self.data['time'][-1])
+
+    def interpolate(self, time_pts, chunk_points=CHUNK_POINTS):
+        """Linear interpolation of every column at time_pts (any shape).
+
+        Times before the first or after the last sample take the end values.
+        The grid is processed in chunks; for each chunk the bracketing rows
+        are located by binary search on the memory map and gathered, so only
+        the pages that hold those rows are read.
+        """
+        time_pts = np.asarray(time_pts, dtype=float)
+        flat = time_pts.ravel()
+        out = {name: np.empty(flat.shape) for name in self.columns}
+        times = self.data['time']
+        last = len(self.data) - 1
+
+        for start in range(0, len(flat), chunk_points):
+            t = flat[start:start + chunk_points]
+            hi = np.clip(np.searchsorted(times, t), 1, last)
+            lo = hi - 1
+            rows_lo = self.data[lo]
+            rows_hi = self.data[hi]
+            w = np.clip((t - rows_lo['time']) / (rows_hi['time'] - rows_lo['time']), 0, 1)
+            for name in self.columns:
+                out[name][start:start + chunk_points] = rows_lo[name] + w * (rows_hi[name] - rows_lo[name])
+
+        return {name: values.reshape(time_pts.shape) for name, values in out.items()}
+
+
+def csv_to_npy(csv_path, npy_path=None, chunk_rows=CHUNK_ROWS):
+    """Convert a forcing CSV into a structured .npy file, streaming in chunks.
+
+    The CSV needs a header with 'time' and any of FORCING_COLUMNS. Rows are
+    counted in a first pass so the output can be allocated as a memory map
+    and filled chunk by chunk without holding the series in memory.
+    """
+    npy_path = npy_path or os.path.splitext(csv_path)[0] + '.npy'
+    with open(csv_path, newline='') as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader)]
+        n_rows = sum(1 for row in reader if row)
+
+    columns = ['time'] + [name for name in FORCING_COLUMNS if name in header]
+    if 'time' not in header or len(columns) == 1:
+        raise ValueError(f"{os.path.basename(csv_path)} needs a 'time' column and one of {', '.join(FORCING_COLUMNS)}")
+    dtype = np.dtype([(name, 'f8') for name in columns])
+    index = [header.index(name) for name in columns]
+
+    out = np.lib.format.open_memmap(npy_path, mode='w+', dtype=dtype, shape=(n_rows,))
+    with open(csv_path, newline='') as f:
+        reader = csv.reader(f)
+        next(reader)
+        chunk = []
+        pos = 0
+        for row in reader:
+            if not row:
+                continue
+            chunk.append(tuple(float(row[i]) for i in index))
+            if len(chunk) == chunk_rows:
+                out[pos:pos + len(chunk)] = chunk
+                pos += len(chunk)
+                chunk = []
+        if chunk:
+            out[pos:pos + len(chunk)] = chunk
+    out.flush()
+    del out
+    return npy_path
+
+
+def load_forcing(path):
+    """Open a forcing series from .npy, or from .csv through a cached .npy copy"""
+    if path.lower().endswith('.csv'):
+        npy_path = os.path.splitext(path)[0] + '.npy'
+        if not os.path.exists(npy_path) or os.path.getmtime(npy_path) < os.path.getmtime(path):
+            csv_to_npy(path, npy_path)
+        path = npy_path
+    return ForcingSeries(path)
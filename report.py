@@ -0,0 +1,127 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+import batch
+import engine
+import export
+import scene
+import survival
+
+try:
+    import pypdf
+except ModuleNotFoundError:     # optional, needed to render pages in parallel
+    pypdf = None
+
+TITLE = "Titanic sinking scenarios"
+PAGE_SIZE = (8.27, 11.69)   # A4 portrait, inches
+MARKS = (0.25, 0.5, 0.75)   # shares of the run shown as ship snapshots, with the last step
+
+
+def mark_indices(n_points):
+    """Time steps of the snapshots, the ones the GUI results panel is updated at"""
+    return [int(n_points * mark) for mark in MARKS] + [n_points - 1]
+
+
+def summarize(result, params):
+    """Results table of one run, as (label, text) rows"""
+    summary = batch.analyze(result, params)
+
+    def fmt(t):
+        return "not reached" if t is None else f"{t:.1f} min"
+    return [
+        ("Critical point", fmt(summary['critical_time'])),
+        ("Total sinking time", fmt(summary['sink_time'])),
+        ("Hull break-up", fmt(summary['break_time'])),
+        ("Maximum sinking level", f"{summary['max_sink_pct']:.1f}%"),
+        ("Maximum tilt angle", f"{summary['max_tilt_angle']:.1f}°"),
+        ("People in lifeboats", f"{summary['in_boats']} of {summary['people']}"),
+        (f"Survivors at rescue ({survival.RESCUE_TIME:.0f} min)", f"{summary['survivors_at_rescue']:.0f}"),
+    ]
+
+
+def render_page(title, params, result):
+    """One report page: forces graph, ship snapshots and the parameter and results tables"""
+    states = export.frame_states(result)
+    time_pts = states['time_pts']
+    marks = mark_indices(len(time_pts))
+
+    fig = Figure(figsize=PAGE_SIZE)
+    FigureCanvasAgg(fig)
+    fig.suptitle(title, fontsize=14)
+    grid = fig.add_gridspec(3, 4, height_ratios=[3, 1.2, 2], left=0.09, right=0.91,
+                            top=0.94, bottom=0.03, hspace=0.3, wspace=0.1)
+
+    forces = scene.ForcesScene(fig.add_subplot(grid[0, :]))
+    forces.start(time_pts, states['ship_weight'])
+    forces.fit(time_pts, states['buoyancy'], states['ship_weight'])
+    forces.set_series(time_pts, states['buoyancy'], states['sink_pct'], states['tilt_angle'])
+
+    # The ship as the animation shows it at each mark; lifeboat drift depends on every earlier frame
+    for col, idx in enumerate(marks):
+        ship = scene.ShipScene(fig.add_subplot(grid[1, col]))
+        ship.start(params['compartments'], params['breached_compartments'])
+        for i in range(1, idx + 1):
+            ship.update(states['sink_pct'][i-1] / 100, states['tilt_angle'][i-1])
+        ship.ax.set_title(f"{time_pts[idx]:.0f} min, {states['sink_pct'][idx]:.0f}% sunk", fontsize=9)
+        ship.ax.set_axis_off()
+
+    rows = [(name.replace('_', ' ').capitalize(), f"{params[name]:g}") for name in engine.PARAM_NAMES]
+    for col, (heading, cells) in enumerate([("Parameter", rows), ("Result", summarize(result, params))]):
+        ax = fig.add_subplot(grid[2, 2 * col:2 * col + 2])
+        ax.set_axis_off()
+        table = ax.table(cellText=[list(row) for row in cells], colLabels=[heading, "Value"],
+                         loc='upper center', cellLoc='left', colWidths=[0.62, 0.38])
+        table.auto_set_font_size(False)
+        table.set_fontsize(8)
+        table.scale(1, 1.3)
+    return fig
+
+
+def page_pdf(title, params, result):
+    """render_page saved as a one-page PDF, returned as bytes"""
+    buf = io.BytesIO()
+    render_page(title, params, result).savefig(buf, format='pdf')
+    return buf.getvalue()
+
+
+def write_report(path, scenarios, workers=None, n_points=engine.N_POINTS):
+    """A multi-page PDF with one page per scenario, e.g.
+    write_report('review.pdf', [{'name': 'Six breached', 'breached_compartments': 6}, ...])
+
+    The scenarios are simulated in one batch. Worker processes build and
+    save the pages, which include each run's evacuation and hull strength
+    analysis, as one-page PDFs; this process only joins them in order with
+    pypdf. Without pypdf the pages are rendered one after the other here,
+    since saving figures to a single PdfPages cannot be split across
+    processes.
+    """
+    params, results = batch.run_scenarios(scenarios, n_points)
+    titles = [s.get('name', f"Scenario {k + 1}") for k, s in enumerate(scenarios)]
+    workers = min(workers or os.cpu_count() or 1, len(scenarios))
+
+    if workers == 1 or pypdf is None:
+        with PdfPages(path, metadata={'Title': TITLE}) as pdf:
+            for fig in map(render_page, titles, params, results):
+                pdf.savefig(fig)
+        return path
+
+    writer = pypdf.PdfWriter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for page in pool.map(page_pdf, titles, params, results):
+            writer.append(pypdf.PdfReader(io.BytesIO(page)))
+    # Pages rendered apart each embed the same fonts and images
+    writer.compress_identical_objects()
+    writer.add_metadata({'/Title': TITLE})
+    with open(path, 'wb') as f:
+        writer.write(f)
+    return path
+
+
+if __name__ == "__main__":
+    write_report('report.pdf', batch.load_scenarios(batch.PRESETS_FILE))
+    print("Report of the preset scenarios written to report.pdf")
@@ -0,0 +1,206 @@
+import matplotlib.patches as patches
+import matplotlib.transforms as mtransforms
+import numpy as np
+
+HULL_HEIGHT = 1.2
+MARGIN = 0.05               # share of the data range left around the curves
+
+
+class ForcesScene:
+    """Forces graph built once per axes; runs only replace line data and limits.
+
+    Weight and buoyancy (MN) are on the left axis, sinking level and tilt on
+    a twin axis that is created here once and hidden between runs.
+    """
+
+    def __init__(self, ax):
+        self.ax = ax
+        self.ax2 = ax.twinx()
+        ax.set_title("Titanic Sinking Simulation")
+        ax.set_xlabel("Time (min)")
+        ax.grid(True)
+        self.ax2.set_ylabel("Sinking Level (%)", color='g')
+        self.ax2.set_ylim(0, 100)
+
+        (self.weight,) = ax.plot([], [], 'r--', label="Ship Weight (MN)")
+        (self.buoyancy,) = ax.plot([], [], 'b-', label="Buoyancy Force (MN)")
+        (self.sink,) = self.ax2.plot([], [], 'g-', label="Sinking Level (%)")
+        (self.tilt,) = self.ax2.plot([], [], 'm--', label="Tilt Angle (°)")
+        self.lines = (self.weight, self.buoyancy, self.sink, self.tilt)
+        self.legends = (ax.legend(loc='upper right'),
+                        self.ax2.legend(loc='upper right', bbox_to_anchor=(1, 0.9)))
+        self.reset()
+
+    def reset(self):
+        """The empty graph shown before a run"""
+        self.active = False
+        for line in self.lines:
+            line.set_data([], [])
+        self.ax.set_ylabel("Force (N)", color='black')
+        self.ax.set_xlim(0, 1)
+        self.ax.set_ylim(0, 1)
+        self.ax2.set_visible(False)
+        for legend in self.legends:
+            legend.set_visible(False)
+
+    def start(self, time_pts, ship_weight):
+        """Show the axes of a run with its weight line and empty series"""
+        self.active = True
+        self.weight.set_data(np.asarray(time_pts)[[0, -1]], [ship_weight, ship_weight])
+        self.set_series([], [], [], [])
+        self.ax.set_ylabel("Force (MN)", color='b')
+        self.ax2.set_visible(True)
+        for legend in self.legends:
+            legend.set_visible(True)
+
+    def set_series(self, time_pts, buoyancy, sink_pct, tilt_angle):
+        self.buoyancy.set_data(time_pts, buoyancy)
+        self.sink.set_data(time_pts, sink_pct)
+        self.tilt.set_data(time_pts, tilt_angle)
+
+    def snapshot(self):
+        """Copies of the displayed data and limits, for drawing the graph elsewhere"""
+        return {
+            'lines': [tuple(np.array(values, dtype=float) for values in line.get_data()) for line in self.lines],
+            'xlim': self.ax.get_xlim(),
+            'ylim': self.ax.get_ylim(),
+        }
+
+    def restore(self, snapshot):
+        """Show what snapshot() captured, possibly on another figure"""
+        self.active = True
+        for line, data in zip(self.lines, snapshot['lines']):
+            line.set_data(*data)
+        self.ax.set_ylabel("Force (MN)", color='b')
+        self.ax.set_xlim(snapshot['xlim'])
+        self.ax.set_ylim(snapshot['ylim'])
+        self.ax2.set_visible(True)
+        for legend in self.legends:
+            legend.set_visible(True)
+
+    def fit(self, time_pts, buoyancy, ship_weight, margin=MARGIN):
+        """Limits holding a whole run, so the animation never rescales"""
+        low = min(np.min(buoyancy), ship_weight)
+        high = max(np.max(buoyancy), ship_weight)
+        pad = margin * (high - low) or margin * abs(high) or 1.0
+        self.ax.set_xlim(time_pts[0], time_pts[-1])
+        self.ax.set_ylim(low - pad, high + pad)
+
+
+class ShipScene:
+    """Side view of the ship, built once; compartment patches are pooled.
+
+    Each run restores the geometry and shows as many compartment outlines as
+    the run has, adding patches only when a run has more than any before.
+    """
+
+    def __init__(self, ax):
+        self.ax = ax
+        self.water = patches.Rectangle((0, -3), 10, 3, facecolor='lightblue', alpha=0.8)
+        ax.add_patch(self.water)
+        self.waterline = ax.axhline(y=0, color='blue', linestyle='-', linewidth=1.5)
+
+        self.hull = patches.Rectangle((2.5, -0.6), 5, HULL_HEIGHT, facecolor='saddlebrown', edgecolor='black')
+        ax.add_patch(self.hull)
+        self.compartments = []
+        self.superstructure = patches.Rectangle((3.5, 0.6), 3, 0.6, facecolor='darkgray', edgecolor='black')
+        ax.add_patch(self.superstructure)
+
+        self.smokestacks = []
+        for pos in (4, 5, 6):
+            stack = patches.Rectangle((pos, 1.2), 0.2, 0.4, facecolor='black', edgecolor='black')
+            ax.add_patch(stack)
+            self.smokestacks.append(stack)
+
+        self.lifeboats = []
+        for i in range(2):
+            lifeboat = patches.Ellipse((3 + i*4, 0.1), 0.5, 0.2, facecolor='brown')
+            ax.add_patch(lifeboat)
+            self.lifeboats.append(lifeboat)
+
+        self.n_compartments = 0
+        self.breached = 0
+        self.reset()
+
+    def artists(self):
+        return ([self.water, self.waterline, self.hull, self.superstructure]
+                + self.smokestacks + self.lifeboats + self.compartments)
+
+    def reset(self):
+        """The empty view shown before a run"""
+        for artist in self.artists():
+            artist.set_visible(False)
+        self.ax.set_title("Ship Status Visualization")
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(-1, 1)
+        self.ax.axis('equal')
+        self.ax.axis('off')
+
+    def start(self, compartments, breached):
+        """Ship afloat and level, with outlines for this run's compartments"""
+        self.n_compartments = compartments
+        self.breached = breached
+        while len(self.compartments) < compartments:
+            rect = patches.Rectangle((2.5, -0.6), 0, HULL_HEIGHT, facecolor='none', edgecolor='black', linestyle=':')
+            self.ax.add_patch(rect)
+            self.compartments.append(rect)
+
+        comp_width = 5 / compartments
+        for i, rect in enumerate(self.compartments):
+            rect.set_bounds(2.5 + i * comp_width, -0.6, comp_width, HULL_HEIGHT)
+            rect.set_facecolor('none')
+            rect.set_alpha(None)
+            rect.set_visible(i < compartments)
+        for artist, y in [(self.hull, -0.6), (self.superstructure, 0.6)] + [(stack, 1.2) for stack in self.smokestacks]:
+            artist.set_y(y)
+        for artist in [self.hull, self.superstructure] + self.smokestacks + self.compartments:
+            artist.set_transform(self.ax.transData)
+        for i, lifeboat in enumerate(self.lifeboats):
+            lifeboat.center = (3 + i*4, 0.1)
+
+        for artist in [self.water, self.waterline, self.hull, self.superstructure] + self.smokestacks + self.lifeboats:
+            artist.set_visible(True)
+        self.ax.set_title("Ship Status")
+        self.ax.axis('on')
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(-3, 3)
+        self.ax.axis('equal')
+
+    def update(self, current_sinking, current_tilt):
+        """Move the ship to a sinking fraction (0-1) and trim angle (degrees)"""
+        ship_y_pos = -0.6 - (current_sinking * 1.8)
+
+        center_x = 5.0  # Center of ship
+        center_y = ship_y_pos + 0.6  # Middle of ship height
+
+        t = mtransforms.Affine2D().rotate_deg_around(center_x, center_y, current_tilt) + self.ax.transData
+
+        self.hull.set_y(ship_y_pos)
+        self.hull.set_transform(t)
+
+        self.superstructure.set_y(ship_y_pos + 1.2)
+        self.superstructure.set_transform(t)
+
+        for stack in self.smokestacks:
+            stack.set_y(ship_y_pos + 1.8)
+            stack.set_transform(t)
+
+        for j, rect in enumerate(self.compartments[:self.n_compartments]):
+            rect.set_y(ship_y_pos)
+            rect.set_transform(t)
+
+            if j < self.breached and current_sinking > 0:
+                water_height = min(1.2, current_sinking * 2.5)
+                rect.set_facecolor('lightblue')
+                rect.set_alpha(0.7)
+                if water_height > 0:
+                    rect.set_height(water_height)
+
+        for boat_idx, lifeboat in enumerate(self.lifeboats):
+            if current_sinking > 0.3:
+                lifeboat_x, _ = lifeboat.center
+                drift = min(3, current_sinking * 5)
+                if boat_idx == 0:
+                    lifeboat.center = (lifeboat_x - drift, 0.1)
+                else:
+                    lifeboat.center = (lifeboat_x + drift, 0.1)
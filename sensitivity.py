@@ -0,0 +1,142 @@
+import numpy as np
+
+import engine
+import sweep
+
+# Inputs whose influence is reported, and the range each is sampled over for
+# the global indices. Integer parameters are rounded after sampling.
+SENSITIVITY_PARAMS = ('ship_mass', 'ship_volume', 'water_density', 'leak_rate',
+                      'compartments', 'breached_compartments', 'temperature', 'wind_speed')
+INTEGER_PARAMS = ('compartments', 'breached_compartments')
+SAMPLE_RANGES = {
+    'ship_mass': (4.7e7, 5.7e7),
+    'ship_volume': (60000, 72000),
+    'water_density': (1020, 1030),
+    'leak_rate': (250, 550),
+    'compartments': (12, 20),
+    'breached_compartments': (2, 8),
+    'temperature': (-4, 4),
+    'wind_speed': (0, 25),
+}
+OUTPUTS = ('critical_time', 'sink_time')
+HORIZON = 600               # min, long enough that most scenarios reach both events
+N_POINTS = 1201
+RELATIVE_STEP = 0.01        # finite-difference step for continuous parameters
+
+
+def _censored(times, horizon=HORIZON):
+    """Events that never happen count as happening at the horizon"""
+    return {key: np.where(np.isnan(times[key]), horizon, times[key]) for key in OUTPUTS}
+
+
+def _valid_integers(columns):
+    """Round integer inputs and keep breached compartments between 1 and compartments"""
+    out = dict(columns)
+    for name in INTEGER_PARAMS:
+        out[name] = np.round(out[name]).astype(int)
+    out['compartments'] = np.maximum(out['compartments'], 1)
+    out['breached_compartments'] = np.clip(out['breached_compartments'], 1, out['compartments'])
+    return out
+
+
+def local_sensitivity(names=SENSITIVITY_PARAMS, n_points=N_POINTS, **params):
+    """Central-difference derivatives of the event times at one parameter set.
+
+    The base point and the two perturbed points of every parameter (2P + 1
+    scenarios) go through a single engine call. Integer parameters step by
+    one, one-sided where the other side is not a valid ship. Returns, per
+    output and parameter, 'derivative' (minutes per unit) and 'elasticity'
+    (% change of the output per % change of the input).
+    """
+    base = dict(engine.DEFAULT_PARAMS, **params)
+    base['simulation_time'] = HORIZON
+    columns = {name: np.full(2 * len(names) + 1, float(base[name])) for name in engine.PARAM_NAMES}
+    for k, name in enumerate(names):
+        step = 1.0 if name in INTEGER_PARAMS else RELATIVE_STEP * max(abs(base[name]), 1.0)
+        columns[name][2 * k + 1] += step
+        columns[name][2 * k + 2] -= step
+    columns = _valid_integers(columns)
+
+    batch = engine.simulate_batch(n_points=n_points, **columns)
+    times = _censored(engine.event_times(batch))
+
+    report = {}
+    for output in OUTPUTS:
+        y = times[output]
+        report[output] = {}
+        for k, name in enumerate(names):
+            up, down = 2 * k + 1, 2 * k + 2
+            dx = columns[name][up] - columns[name][down]
+            derivative = (y[up] - y[down]) / dx if dx else 0.0
+            report[output][name] = {
+                'derivative': float(derivative),
+                'elasticity': float(derivative * base[name] / y[0]),
+            }
+    return report
+
+
+def saltelli_samples(n_samples, names=SENSITIVITY_PARAMS, ranges=SAMPLE_RANGES, seed=None):
+    """The A, B and AB_i matrices of Saltelli's scheme stacked as (P + 2, N, P)"""
+    rng = np.random.default_rng(seed)
+    lo = np.array([ranges[name][0] for name in names], dtype=float)
+    hi = np.array([ranges[name][1] for name in names], dtype=float)
+    a = lo + rng.random((n_samples, len(names))) * (hi - lo)
+    b = lo + rng.random((n_samples, len(names))) * (hi - lo)
+    ab = np.repeat(a[None], len(names), axis=0)
+    for i in range(len(names)):
+        ab[i, :, i] = b[:, i]
+    return np.concatenate([a[None], b[None], ab])
+
+
+def sobol_indices(n_samples=1024, names=SENSITIVITY_PARAMS, ranges=SAMPLE_RANGES, workers=None,
+                  seed=None, n_points=N_POINTS, **params):
+    """First-order and total Sobol indices of the event times.
+
+    All N (P + 2) samples are evaluated as one sweep, spread over worker
+    processes by sweep.run_sweep. Uses Saltelli's estimator for first-order
+    and Jansen's for total effects. Integer inputs are rounded, and
+    breached_compartments is capped at compartments. Parameters not in names
+    stay at params or the engine defaults.
+    """
+    samples = saltelli_samples(n_samples, names, ranges, seed).reshape(-1, len(names))
+    base = dict(engine.DEFAULT_PARAMS, **params)
+    base['simulation_time'] = HORIZON
+    columns = {name: np.full(len(samples), float(base[name])) for name in engine.PARAM_NAMES}
+    columns.update({name: samples[:, k] for k, name in enumerate(names)})
+    columns = _valid_integers(columns)
+
+    times = _censored(sweep.run_sweep(workers=workers, n_points=n_points, keys=OUTPUTS,
+                                      interpolate_events=True, **columns))
+
+    report = {}
+    for output in OUTPUTS:
+        y = times[output].reshape(len(names) + 2, n_samples)
+        f_a, f_b, f_ab = y[0], y[1], y[2:]
+        variance = np.var(np.concatenate([f_a, f_b]))
+        if variance == 0:
+            first = total = np.zeros(len(names))
+        else:
+            first = np.mean(f_b * (f_ab - f_a), axis=1) / variance
+            total = 0.5 * np.mean((f_a - f_ab) ** 2, axis=1) / variance
+        report[output] = {name: {'first_order': float(first[k]), 'total': float(total[k])}
+                          for k, name in enumerate(names)}
+    return report
+
+
+def print_report(local, sobol=None):
+    """Table of local elasticities and, if given, Sobol indices, most influential first"""
+    for output in OUTPUTS:
+        print(f"\n{output}")
+        print(f"  {'parameter':<24}{'derivative':>14}{'elasticity':>12}"
+              + (f"{'S1':>8}{'ST':>8}" if sobol else ""))
+        ranked = sorted(local[output], key=lambda name: -abs(local[output][name]['elasticity']))
+        for name in ranked:
+            row = local[output][name]
+            line = f"  {name:<24}{row['derivative']:>14.4g}{row['elasticity']:>12.3f}"
+            if sobol and name in sobol[output]:
+                line += f"{sobol[output][name]['first_order']:>8.3f}{sobol[output][name]['total']:>8.3f}"
+            print(line)
+
+
+if __name__ == "__main__":
+    print_report(local_sensitivity(), sobol_indices(n_samples=512, seed=0))
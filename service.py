@@ -0,0 +1,304 @@
+import ipaddress
+import json
+import os
+import socket
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+import engine
+import sweep
+
+HOST = '127.0.0.1'
+PORT = 8765
+BATCH_WINDOW = 0.005        # s a single run waits for others to share its simulate_batch call
+MAX_BATCH = 512             # single runs per batch
+CACHE_BYTES = 256 * 2**20   # memory of the finished requests kept, least recently used dropped first
+ENTRY_OVERHEAD = 1024       # bytes counted per cached request besides its arrays
+MAX_POINTS = 10000          # time samples per run
+MAX_COMPARTMENTS = 64       # sizes the engine's per-compartment arrays
+MAX_SWEEP_ROWS = 100000     # scenarios per sweep request
+MAX_SWEEP_VALUES = 20000000     # numbers a sweep may return, scenarios × outputs (series count n_points)
+SWEEP_WORKERS = os.cpu_count() or 1     # processes of the pool all sweeps share
+REQUEST_TIMEOUT = 120       # s
+SWEEP_KEYS = sweep.SUMMARY_KEYS + engine.SERIES_KEYS
+
+
+def _json_value(value):
+    """Engine outputs as JSON: arrays as (nested) lists, NaN and None as null"""
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == 'f':
+            return np.where(np.isnan(value), None, value).tolist()
+        return value.tolist()
+    if isinstance(value, (float, np.floating)):
+        return None if np.isnan(value) else float(value)
+    return value
+
+
+def _check_n_points(n_points):
+    if not isinstance(n_points, int) or not 2 <= n_points <= MAX_POINTS:
+        raise ValueError(f"n_points must be an integer between 2 and {MAX_POINTS}")
+
+
+def _check_params(params):
+    """Broadcast and validated parameters, rejecting anything that is not a finite number"""
+    if not isinstance(params, dict):
+        raise ValueError("params must be a JSON object")
+    p = engine.broadcast_params(**params)
+    for name in engine.PARAM_NAMES:
+        if not np.all(np.isfinite(p[name])):
+            raise ValueError(f"{name} must be a finite number")
+    if np.any(p['compartments'] > MAX_COMPARTMENTS):
+        raise ValueError(f"compartments can be at most {MAX_COMPARTMENTS}")
+    engine.validate_params(p)
+    return p
+
+
+def _nbytes(value):
+    """Memory held by a finished request: (SimulationResult, events) or a dict of arrays"""
+    if isinstance(value, tuple):
+        result, _ = value
+        return result.series.nbytes + np.asarray(result.final_water).nbytes + ENTRY_OVERHEAD
+    return sum(array.nbytes for array in value.values()) + ENTRY_OVERHEAD
+
+
+class SimulationService:
+    """Thread-safe front end to the engine for many concurrent callers.
+
+    Finished requests are kept in an LRU cache keyed by their parameters,
+    up to cache_bytes of results. A request identical to one still running
+    waits for that one instead of running again. Single runs are queued for
+    a few milliseconds and run together in one vectorized simulate_batch
+    call on a background thread. Sweeps share one pool of sweep_workers
+    processes, so concurrent sweeps queue for it rather than each starting
+    their own.
+    """
+
+    def __init__(self, window=BATCH_WINDOW, max_batch=MAX_BATCH, cache_bytes=CACHE_BYTES,
+                 sweep_workers=SWEEP_WORKERS):
+        self.window = window
+        self.max_batch = max_batch
+        self.cache_bytes = cache_bytes
+        self.sweep_workers = sweep_workers
+        self.counts = Counter()
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._cache = OrderedDict()
+        self._cached_bytes = 0
+        self._inflight = {}
+        self._queue = []
+        self._closed = False
+        self._pool = ProcessPoolExecutor(max_workers=sweep_workers) if sweep_workers > 1 else None
+        threading.Thread(target=self._run_batches, daemon=True, name='simulation-batcher').start()
+
+    def close(self):
+        with self._ready:
+            self._closed = True
+            self._ready.notify()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    def _lookup(self, key):
+        """(future, new): the cached or in-flight answer for key, or a new
+        future that the caller must complete with _finish"""
+        with self._lock:
+            self.counts['requests'] += 1
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.counts['cache_hits'] += 1
+                future = Future()
+                future.set_result(self._cache[key][0])
+                return future, False
+            if key in self._inflight:
+                self.counts['coalesced'] += 1
+                return self._inflight[key], False
+            future = self._inflight[key] = Future()
+            return future, True
+
+    def _finish(self, key, value=None, error=None):
+        with self._lock:
+            future = self._inflight.pop(key)
+            size = _nbytes(value) if error is None else 0
+            if error is None and size <= self.cache_bytes:
+                self._cache[key] = (value, size)
+                self._cached_bytes += size
+                while self._cached_bytes > self.cache_bytes:
+                    _, (_, dropped) = self._cache.popitem(last=False)
+                    self._cached_bytes -= dropped
+        if error is None:
+            future.set_result(value)
+        else:
+            future.set_exception(error)
+
+    def simulate(self, params, n_points=engine.N_POINTS):
+        """(result, events): one run as a SimulationResult and its interpolated event times"""
+        _check_n_points(n_points)
+        p = _check_params(params)
+        if len(p['simulation_time']) != 1:
+            raise ValueError("simulate takes scalar parameters, use sweep for several scenarios")
+        values = tuple(p[name][0].item() for name in engine.PARAM_NAMES)
+        key = ('simulate', n_points) + values
+
+        future, new = self._lookup(key)
+        if new:
+            with self._ready:
+                self._queue.append((key, n_points, values))
+                self._ready.notify()
+        return future.result(REQUEST_TIMEOUT)
+
+    def sweep(self, params, n_points=engine.N_POINTS, keys=sweep.SUMMARY_KEYS, interpolate_events=False):
+        """The outputs named in keys for every scenario of a broadcast sweep"""
+        _check_n_points(n_points)
+        if isinstance(keys, str) or not isinstance(keys, (list, tuple)) \
+                or not all(isinstance(key, str) for key in keys):
+            raise ValueError("keys must be a list of output names")
+        unknown = set(keys) - set(SWEEP_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown outputs: {', '.join(sorted(unknown))}")
+        p = _check_params(params)
+        rows = len(p['simulation_time'])
+        if rows > MAX_SWEEP_ROWS:
+            raise ValueError(f"A sweep can have at most {MAX_SWEEP_ROWS} scenarios")
+        values = rows * sum(n_points if key in engine.SERIES_KEYS else 1 for key in set(keys))
+        if values > MAX_SWEEP_VALUES:
+            raise ValueError(f"A sweep can return at most {MAX_SWEEP_VALUES} values, "
+                             f"this one would return {values} (scenarios × outputs × n_points for series)")
+        key = ('sweep', n_points, tuple(keys), bool(interpolate_events)) \
+            + tuple(p[name].tobytes() for name in engine.PARAM_NAMES)
+
+        future, new = self._lookup(key)
+        if new:
+            try:
+                result = sweep.run_sweep(workers=self.sweep_workers, n_points=n_points, keys=tuple(keys),
+                                         interpolate_events=interpolate_events, executor=self._pool, **p)
+                with self._lock:
+                    self.counts['sweeps'] += 1
+                self._finish(key, {name: np.array(value) for name, value in result.items()})
+            except Exception as e:
+                self._finish(key, error=e)
+        return future.result(REQUEST_TIMEOUT)
+
+    def _run_batches(self):
+        while True:
+            with self._ready:
+                while not self._queue and not self._closed:
+                    self._ready.wait()
+                if self._closed:
+                    return
+            # Let requests arriving at about the same time join this batch
+            time.sleep(self.window)
+            with self._lock:
+                jobs, self._queue = self._queue[:self.max_batch], self._queue[self.max_batch:]
+            for n_points in sorted({n for _, n, _ in jobs}):
+                self._run_group([job for job in jobs if job[1] == n_points], n_points)
+
+    def _run_group(self, jobs, n_points):
+        columns = {name: [values[i] for _, _, values in jobs] for i, name in enumerate(engine.PARAM_NAMES)}
+        try:
+            batch = engine.simulate_batch(n_points=n_points, **columns)
+            events = engine.event_times(batch)
+        except Exception as e:
+            for key, _, _ in jobs:
+                self._finish(key, error=e)
+            return
+        with self._lock:
+            self.counts['batches'] += 1
+            self.counts['runs'] += len(jobs)
+        for k, (key, _, _) in enumerate(jobs):
+            # Packed into its own record array, so a cached run does not keep the whole batch alive
+            self._finish(key, (engine.scenario(batch, k), {name: float(value[k]) for name, value in events.items()}))
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counts, cached=len(self._cache), cached_bytes=self._cached_bytes,
+                        in_flight=len(self._inflight))
+
+
+class Handler(BaseHTTPRequestHandler):
+    """JSON over HTTP.
+
+    POST /simulate  {"params": {...}, "n_points": 300, "series": false, "interpolate_events": false}
+    POST /sweep     {"params": {name: value or list}, "n_points": 300, "keys": [...], "interpolate_events": false}
+    GET  /stats     request, cache and batch counters
+    """
+
+    server_version = 'TitanicSimulator/1.0'
+
+    def do_GET(self):
+        if self.path == '/stats':
+            return self._reply(200, self.server.service.stats())
+        self._reply(404, {'error': f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        routes = {'/simulate': self.simulate, '/sweep': self.sweep}
+        if self.path not in routes:
+            return self._reply(404, {'error': f"Unknown path {self.path}"})
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            body = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(body, dict):
+                raise ValueError("Request body must be a JSON object")
+            reply = routes[self.path](body)
+        except (ValueError, TypeError) as e:
+            return self._reply(400, {'error': str(e)})
+        except Exception as e:
+            return self._reply(500, {'error': f"{type(e).__name__}: {e}"})
+        self._reply(200, reply)
+
+    def simulate(self, body):
+        result, events = self.server.service.simulate(body.get('params', {}), body.get('n_points', engine.N_POINTS))
+        times = events if body.get('interpolate_events') else result
+        reply = {
+            'critical_time': _json_value(times['critical_time']),
+            'sink_time': _json_value(times['sink_time']),
+            'ship_weight': result.ship_weight,
+        }
+        if body.get('series'):
+            reply.update({key: _json_value(result[key]) for key in engine.SERIES_KEYS})
+        return reply
+
+    def sweep(self, body):
+        result = self.server.service.sweep(body.get('params', {}), body.get('n_points', engine.N_POINTS),
+                                           body.get('keys', list(sweep.SUMMARY_KEYS)),
+                                           body.get('interpolate_events', False))
+        return {key: _json_value(value) for key, value in result.items()}
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload, allow_nan=False).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    request_queue_size = 128    # connections waiting to be accepted, for bursts of concurrent clients
+
+
+def make_server(host=HOST, port=PORT, service=None):
+    """An HTTP server for the service, bound to a loopback address only; port=0 picks a free port"""
+    if not ipaddress.ip_address(socket.gethostbyname(host)).is_loopback:
+        raise ValueError(f"The simulation service only listens on localhost, not {host}")
+    server = Server((host, port), Handler)
+    server.service = service or SimulationService()
+    return server
+
+
+if __name__ == "__main__":
+    server = make_server()
+    print(f"Simulation service on http://{HOST}:{server.server_address[1]} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.close()
@@ -0,0 +1,119 @@
+import functools
+
+import numpy as np
+
+# Intact hull of the Titanic, used to build the righting-arm curve
+LENGTH = 269.0      # m, length between perpendiculars
+BEAM = 28.0         # m
+DRAFT = 10.5        # m, load draft
+DEPTH = 19.7        # m, keel to bulkhead deck
+KG = 13.0           # m, height of centre of gravity above keel
+
+MAX_TILT = 45       # degrees, angle drawn once the ship founders
+ANGLE_STEP = 0.1    # degrees, resolution of the precomputed curve
+
+
+@functools.lru_cache(maxsize=None)
+def righting_arm_curve(length=LENGTH, beam=BEAM, draft=DRAFT, depth=DEPTH, kg=KG, step=ANGLE_STEP):
+    """Longitudinal righting arm GZ(θ) of a box-like hull on a trim-angle grid.
+
+    Uses the wall-sided formula GZ = sinθ (GM + ½ BM tan²θ) up to the angle at
+    which the bow deck edge immerses, then lets GZ fall linearly to zero at
+    MAX_TILT. Returns (angles_deg, gz, gm) where gm is the upright metacentric
+    height the curve was built with. The curve only depends on the hull, so it
+    is computed once and shared by every run.
+    """
+    kb = draft / 2
+    bm = length ** 2 / (12 * draft)
+    gm = kb + bm - kg
+
+    angles = np.arange(0, MAX_TILT + step / 2, step)
+    theta = np.radians(angles)
+    gz = np.sin(theta) * (gm + 0.5 * bm * np.tan(theta) ** 2)
+
+    deck_edge = np.degrees(np.arctan(2 * (depth - draft) / length))
+    beyond = angles > deck_edge
+    gz_deck = np.interp(deck_edge, angles, gz)
+    gz[beyond] = gz_deck * (MAX_TILT - angles[beyond]) / (MAX_TILT - deck_edge)
+
+    for arr in (angles, gz):
+        arr.setflags(write=False)
+    return angles, gz, gm
+
+
+@functools.lru_cache(maxsize=None)
+def _equilibrium_table(step=ANGLE_STEP):
+    """Rising branch of GZ/cosθ, the curve a static trimming lever is balanced on"""
+    angles, gz, gm = righting_arm_curve(step=step)
+    ratio = gz / np.cos(np.radians(angles))
+    peak = int(np.argmax(ratio))
+    return angles[:peak + 1], ratio[:peak + 1], gm
+
+
+def _balance(lever, total_water, free_surface, ship_mass, ship_volume, water_density):
+    """Trim for a trimming lever, from the righting-arm curve with its
+    stiffness reduced by the lost reserve buoyancy and the free surface"""
+    angles, ratio, gm = _equilibrium_table()
+
+    reserve = np.maximum(ship_volume - ship_mass / water_density, 1e-9)[:, None]
+    stiffness = 1 - total_water / reserve - free_surface / (gm * (ship_mass / water_density)[:, None])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        demand = np.where(stiffness > 0, lever / stiffness, np.inf)
+    tilt = np.interp(demand, ratio, angles)
+
+    # Foundering: beyond the peak of the curve trim follows the remaining flooding
+    lost = demand > ratio[-1]
+    progress = np.clip((total_water - reserve) / (ship_volume[:, None] - reserve), 0, 1)
+    plunge = angles[-1] + progress * (MAX_TILT - angles[-1])
+    return np.where(lost, plunge, tilt)
+
+
+def trim_angle(comp_water, compartments, ship_mass, ship_volume, water_density):
+    """Bow-down trim (degrees) from the distribution of flood water.
+
+    comp_water is (S, n, C) flood volume per compartment, compartment 0 at the
+    bow; the other arguments are per-scenario arrays of shape (S,). The
+    trimming lever of the flood water is balanced against the cached
+    righting-arm curve, whose stiffness is scaled down by the reserve buoyancy
+    already lost and by the free surface of partly filled compartments. Once
+    the lever exceeds what the hull can resist, the ship founders and the trim
+    grows with the remaining flooding up to MAX_TILT.
+    """
+    n_comp = compartments[:, None, None]
+    comp_len = LENGTH / n_comp
+    j = np.arange(comp_water.shape[-1])
+    arm = LENGTH / 2 - (j + 0.5) * comp_len           # forward of midships
+
+    rho = water_density[:, None]
+    total_water = comp_water.sum(axis=-1)
+    lever = rho * (comp_water * arm).sum(axis=-1) / (ship_mass[:, None] + rho * total_water)
+
+    comp_size = (ship_volume[:, None] / compartments[:, None])[:, :, None]
+    partial = (comp_water > 0) & (comp_water < comp_size)
+    free_surface = (partial * BEAM * comp_len ** 3 / 12).sum(axis=-1)
+    return _balance(lever, total_water, free_surface, ship_mass, ship_volume, water_density)
+
+
+def cascade_trim_angle(water_vol, compartments, ship_mass, ship_volume, water_density):
+    """trim_angle for water filling the compartments from the bow aft, as
+    engine.compartment_water splits it, from the total water (S, n) alone.
+
+    With k compartments full and the next one holding the rest r, the moment
+    of the water about midships is s·k·(L/2 − k·l/2) + r·(L/2 − (k + ½)·l)
+    for compartments of volume s and length l, and only that one compartment
+    has a free surface, so no per-compartment arrays are needed.
+    """
+    n_comp = compartments[:, None]
+    comp_len = LENGTH / n_comp
+    comp_size = (ship_volume / compartments)[:, None]
+
+    full = np.minimum(np.floor(water_vol / comp_size), n_comp)
+    rest = np.clip(water_vol - full * comp_size, 0, comp_size)
+    moment = (comp_size * full * (LENGTH / 2 - full * comp_len / 2)
+              + rest * (LENGTH / 2 - (full + 0.5) * comp_len))
+
+    rho = water_density[:, None]
+    lever = rho * moment / (ship_mass[:, None] + rho * water_vol)
+    free_surface = np.where((rest > 0) & (full < n_comp), BEAM * comp_len ** 3 / 12, 0.0)
+    return _balance(lever, water_vol, free_surface, ship_mass, ship_volume, water_density)
@@ -0,0 +1,126 @@
+import json
+import os
+
+import numpy as np
+
+import engine
+import sweep
+
+STORE_KEYS = ('critical_time', 'sink_time', 'water_vol', 'sink_pct', 'tilt_angle')
+BLOCK_ROWS = 20000          # scenarios computed and committed per fill step
+INDEX_FILE = 'index.npy'
+META_FILE = 'meta.json'
+
+
+def grid(**axes):
+    """Every combination of the given parameter values, as flat columns for ResultStore.create"""
+    names = list(axes)
+    mesh = np.meshgrid(*(np.atleast_1d(axes[name]) for name in names), indexing='ij')
+    return {name: values.ravel() for name, values in zip(names, mesh)}
+
+
+class ResultStore:
+    """Sweep results on disk, read and written through memory maps.
+
+    A store is a directory with one fixed-dtype .npy array per output, shaped
+    (scenarios,) for event times or (scenarios, n_points) for time series,
+    and an index: a structured array with every engine parameter and a 'done'
+    flag per scenario. fill() computes missing scenarios block by block and
+    commits each block, so an interrupted fill resumes where it stopped.
+    select() and get() read only the rows asked for.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, META_FILE)) as f:
+            self.meta = json.load(f)
+        self.index = np.load(os.path.join(path, INDEX_FILE), mmap_mode='r+')
+        self.keys = tuple(self.meta['keys'])
+
+    @classmethod
+    def create(cls, path, n_points=engine.N_POINTS, keys=STORE_KEYS, dtype='float32',
+               interpolate_events=True, **params):
+        """Allocate a store for the scenarios given by params (broadcast as in simulate_batch)"""
+        p = engine.broadcast_params(**params)
+        engine.validate_params(p)
+        n_rows = len(p['simulation_time'])
+        os.makedirs(path, exist_ok=True)
+
+        fields = [(name, p[name].dtype) for name in engine.PARAM_NAMES] + [('done', bool)]
+        index = np.lib.format.open_memmap(os.path.join(path, INDEX_FILE), mode='w+',
+                                          dtype=fields, shape=(n_rows,))
+        for name in engine.PARAM_NAMES:
+            index[name] = p[name]
+        index['done'] = False
+        index.flush()
+
+        for key in keys:
+            shape = (n_rows,) if key in sweep.SUMMARY_KEYS else (n_rows, n_points)
+            np.lib.format.open_memmap(os.path.join(path, f"{key}.npy"), mode='w+',
+                                      dtype=dtype, shape=shape).flush()
+
+        with open(os.path.join(path, META_FILE), 'w') as f:
+            json.dump({'keys': list(keys), 'n_points': n_points,
+                       'interpolate_events': interpolate_events}, f)
+        return cls(path)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, key):
+        """The whole output as a read-only memory map"""
+        if key not in self.keys:
+            raise KeyError(f"Store has no output '{key}'")
+        return np.load(os.path.join(self.path, f"{key}.npy"), mmap_mode='r')
+
+    @property
+    def complete(self):
+        return bool(self.index['done'].all())
+
+    def fill(self, workers=None, block_rows=BLOCK_ROWS, chunk_size=sweep.CHUNK_SIZE):
+        """Compute every scenario not yet done, committing block_rows at a time"""
+        pending = np.flatnonzero(~self.index['done'])
+        outputs = {key: np.load(os.path.join(self.path, f"{key}.npy"), mmap_mode='r+') for key in self.keys}
+
+        for start in range(0, len(pending), block_rows):
+            rows = pending[start:start + block_rows]
+            block = self.index[rows]
+            params = {name: block[name] for name in engine.PARAM_NAMES}
+            results = sweep.run_sweep(workers=workers, chunk_size=chunk_size, n_points=self.meta['n_points'],
+                                      keys=self.keys, interpolate_events=self.meta['interpolate_events'],
+                                      **params)
+            for key in self.keys:
+                outputs[key][rows] = results[key]
+                outputs[key].flush()
+            self.index['done'][rows] = True
+            self.index.flush()
+
+    def select(self, **conditions):
+        """Row numbers whose parameters match every condition.
+
+        A condition is a value (matched with np.isclose) or a (low, high)
+        tuple of inclusive bounds.
+        """
+        mask = np.ones(len(self.index), dtype=bool)
+        for name, condition in conditions.items():
+            if name not in engine.PARAM_NAMES and name != 'done':
+                raise ValueError(f"Unknown simulation parameter: {name}")
+            column = self.index[name]
+            if isinstance(condition, tuple):
+                low, high = condition
+                mask &= (column >= low) & (column <= high)
+            else:
+                mask &= np.isclose(column, condition)
+        return np.flatnonzero(mask)
+
+    def get(self, key, **conditions):
+        """One output for the matching scenarios and their index rows,
+        e.g. store.get('sink_pct', breached_compartments=5)"""
+        rows = self.select(**conditions)
+        return self[key][rows], np.asarray(self.index[rows])
+
+
+def create_grid(path, n_points=engine.N_POINTS, keys=STORE_KEYS, dtype='float32', **axes):
+    """A store over the full grid of the given parameter values, e.g.
+    create_grid(path, leak_rate=np.linspace(100, 1000, 50), breached_compartments=range(1, 9))"""
+    return ResultStore.create(path, n_points=n_points, keys=keys, dtype=dtype, **grid(**axes))
@@ -0,0 +1,156 @@
+import numpy as np
+
+import engine
+import stability
+
+N_STATIONS = 100
+# Ultimate hull girder bending moment: a midship section modulus of about
+# 17 m³ with 1912 mild steel failing around 2.4e8 Pa. The Historical preset
+# reaches it at about 158 min, when the hull broke in two at 02:18
+ULTIMATE_MOMENT = 4.1e9     # N·m
+ITERATIONS = 60             # bisection steps of the midship draft
+TOLERANCE = 1e-6            # force and moment residuals, relative to the weight (and length)
+
+
+def station_positions(n_stations=N_STATIONS, length=stability.LENGTH):
+    """Station centres measured from the bow, and the station spacing"""
+    dx = length / n_stations
+    return (np.arange(n_stations) + 0.5) * dx, dx
+
+
+def lightship_weight(ship_mass, x, length=stability.LENGTH):
+    """Weight per metre of the intact ship, heavier amidships (coffin-shaped)"""
+    xi = x / length
+    shape = 1 - 0.5 * (2 * xi - 1) ** 2
+    return ship_mass * engine.G * shape / (shape.sum() * (length / len(x)))
+
+
+def flood_weight(comp_water, compartments, water_density, x, length=stability.LENGTH):
+    """Flood water weight per metre: each compartment's load is spread over its stations"""
+    comp_idx = np.minimum((x / (length / compartments)).astype(int), compartments - 1)
+    comp_len = length / compartments
+    return comp_water[..., comp_idx] * water_density * engine.G / comp_len
+
+
+def buoyancy_distribution(weight, trim, ship_mass, ship_volume, water_density, x, length=stability.LENGTH,
+                          beam=stability.BEAM, draft=stability.DRAFT, iterations=ITERATIONS):
+    """Buoyancy per metre of a box-like hull carrying the load weight (n, stations)
+    at the trim (n,) of the run, degrees bow down, in water of density (n,).
+
+    The hull has the length and beam of the stability module, with the block
+    coefficient that floats the intact ship at its load draft in the run's
+    mean density; its buoyant
+    volume ends at the height where it holds ship_volume, so it stops
+    floating exactly when the flood water exceeds the engine's reserve
+    buoyancy. The midship draft that carries the weight is found by
+    bisection for every time step at once, the draft at each station being
+    clipped between keel and that height. Returns the buoyancy and a mask
+    of the steps where the hull can float the load; elsewhere it is fully
+    immersed.
+    """
+    dx = length / len(x)
+    force = weight.sum(axis=1) * dx
+    water_density = np.broadcast_to(water_density, force.shape)
+    block = ship_mass / water_density.mean() / (length * beam * draft)
+    k = water_density[:, None] * engine.G * beam * block            # buoyancy per metre per metre of draft
+    depth = ship_volume / (length * beam * block)
+    rise = np.tan(np.radians(trim))[:, None] * (length / 2 - x)     # waterline above midships draft
+
+    reach = depth + np.abs(rise).max(axis=1)
+    low, high = -reach, reach
+    for _ in range(iterations):
+        mid = (low + high) / 2
+        short = (k * np.clip(mid[:, None] + rise, 0, depth)).sum(axis=1) * dx < force
+        low, high = np.where(short, mid, low), np.where(short, high, mid)
+
+    b = k * np.clip(high[:, None] + rise, 0, depth)
+    floating = np.abs(b.sum(axis=1) * dx - force) < TOLERANCE * np.maximum(np.abs(force), 1.0)
+    return b, floating
+
+
+def inertia_relief(load, mass, x, length=stability.LENGTH):
+    """Rigid-body inertia load balancing the net force and moment of load.
+
+    Where the hull cannot float its load the ship is accelerating: the
+    D'Alembert load −m(x)·(a + α·(L/2 − x)) of a heave acceleration a and a
+    pitch acceleration α is what closes the girder. Zero where load is
+    already in equilibrium.
+    """
+    dx = length / len(x)
+    lever = length / 2 - x
+    r_force = load.sum(axis=1) * dx
+    r_moment = (load * lever).sum(axis=1) * dx
+    m0 = mass.sum(axis=1) * dx
+    m1 = (mass * lever).sum(axis=1) * dx
+    m2 = (mass * lever ** 2).sum(axis=1) * dx
+    det = m0 * m2 - m1 ** 2
+    heave = (m2 * r_force - m1 * r_moment) / det
+    pitch = (m0 * r_moment - m1 * r_force) / det
+    return -mass * (heave[:, None] + pitch[:, None] * lever)
+
+
+def longitudinal_strength(result, n_stations=N_STATIONS, ultimate_moment=ULTIMATE_MOMENT, forcing=None,
+                          **params):
+    """Shear force and bending moment along the hull for every time step of a run.
+
+    result is what engine.simulate() returns for the same params and
+    forcing. Its water per compartment (breach geometry), or else its total
+    filling the compartments from the bow, loads the girder, in water of the
+    density the run had at each step. The hull lies at the run's trim with
+    the midship draft that carries the weight of the ship and its flood
+    water at every time step; the moment left over by that trim, and once
+    the hull can no longer float the weight the force too, are balanced by
+    the ship's heave and pitch acceleration.
+    Stations and time are laid out as (n_time, n_stations) arrays. Positive
+    moments are sagging (ends pushed up relative to midships), negative
+    ones hogging. The first time the largest |M| exceeds
+    ultimate_moment is reported as the break-up time, together with the
+    station where it happens (metres from the bow).
+    """
+    p = engine.broadcast_params(**params)
+    compartments = int(p['compartments'][0])
+    ship_mass = p['ship_mass'][0]
+    ship_volume = p['ship_volume'][0]
+    env = engine.environment(p, np.asarray(result['time_pts'])[None, :], forcing)
+    rho = engine.adjusted_density(p['water_density'][:, None], env['temperature'])[0]
+
+    x, dx = station_positions(n_stations)
+    comp_water = result.get('comp_water')
+    if comp_water is None:
+        comp_water = engine.compartment_water(
+            result['water_vol'][None, :], p['ship_volume'] / p['compartments'], p['compartments'])[0]
+
+    weight = lightship_weight(ship_mass, x)[None, :] + flood_weight(comp_water, compartments, rho[:, None], x)
+    buoyancy, floating = buoyancy_distribution(weight, result['tilt_angle'], ship_mass, ship_volume, rho, x)
+    load = buoyancy - weight
+    load = load + inertia_relief(load, weight / engine.G, x)
+
+    # Integrate the net load from the bow; in equilibrium both close at the stern
+    shear = np.cumsum(load, axis=1) * dx
+    moment = np.cumsum(shear, axis=1) * dx
+    scale = weight.sum(axis=1) * dx
+    if np.any(np.abs(shear[:, -1]) > TOLERANCE * scale) or \
+            np.any(np.abs(moment[:, -1]) > TOLERANCE * scale * stability.LENGTH):
+        raise RuntimeError("Hull girder loads do not close at the stern")
+
+    max_idx = np.abs(moment).argmax(axis=1)
+    max_moment = np.take_along_axis(moment, max_idx[:, None], axis=1)[:, 0]
+    broken = np.abs(max_moment) > ultimate_moment
+
+    break_time = None
+    break_station = None
+    if broken.any():
+        i = int(broken.argmax())
+        break_time = float(result['time_pts'][i])
+        break_station = float(x[max_idx[i]])
+
+    return {
+        'stations': x,
+        'floating': floating,
+        'shear': shear,
+        'moment': moment,
+        'max_moment': max_moment,
+        'broken': broken,
+        'break_time': break_time,
+        'break_station': break_station,
+    }
@@ -0,0 +1,101 @@
+import os
+
+import numpy as np
+
+import engine
+import sweep
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'surrogate_table.npz')
+
+MAX_COMPARTMENTS = 24
+RESERVE_GRID = np.linspace(0.0, 0.6, 61)     # reserve buoyancy as a fraction of ship volume
+N_POINTS = 2001
+
+_table = None
+
+
+def _nondimensional(p):
+    """Effective inflow scale and reserve-buoyancy fraction of broadcast parameters.
+
+    In the cascading model the event times scale exactly as
+    ship_volume / (leak_rate × wind_factor), leaving them a function of the
+    breached and total compartment counts and the reserve fraction only.
+    """
+    rho = engine.adjusted_density(p['water_density'], p['temperature'])
+    scale = p['ship_volume'] / (p['leak_rate'] * (1.0 + p['wind_speed'] / 100))
+    reserve = 1 - p['ship_mass'] / (rho * p['ship_volume'])
+    return scale, reserve
+
+
+def build_table(path=TABLE_PATH, workers=None):
+    """Sweep every (breached, compartments, reserve) cell and save normalized event times.
+
+    Each cell runs with its own horizon just past the slowest possible sinking
+    (the whole volume at the initial inflow) so the time grid resolves it.
+    """
+    b, n, r = np.meshgrid(np.arange(1, MAX_COMPARTMENTS + 1), np.arange(1, MAX_COMPARTMENTS + 1),
+                          RESERVE_GRID, indexing='ij')
+    valid = b <= n
+    ship_volume = engine.DEFAULT_PARAMS['ship_volume']
+    leak_rate = engine.DEFAULT_PARAMS['leak_rate']
+    water_density = engine.DEFAULT_PARAMS['water_density']
+    horizon = 1.05 * ship_volume / (leak_rate * b[valid] / n[valid])
+
+    times = sweep.run_sweep(
+        workers=workers, n_points=N_POINTS, interpolate_events=True,
+        ship_volume=ship_volume, leak_rate=leak_rate, water_density=water_density,
+        temperature=-2, wind_speed=0,
+        ship_mass=(1 - r[valid]) * water_density * ship_volume,
+        compartments=n[valid], breached_compartments=b[valid], simulation_time=horizon)
+
+    scale = ship_volume / leak_rate
+    table = {}
+    for key in ('critical_time', 'sink_time'):
+        values = np.full(b.shape, np.nan)
+        values[valid] = times[key] / scale
+        table[key] = values
+    np.savez(path, reserve=RESERVE_GRID, **table)
+    return table
+
+
+def load(path=TABLE_PATH, build_if_missing=True):
+    """The lookup table, read from disk on first use (and built there if missing).
+    Returns None when the table does not exist and may not be built."""
+    global _table
+    if _table is None:
+        if not os.path.exists(path):
+            if not build_if_missing:
+                return None
+            build_table(path)
+        with np.load(path) as data:
+            _table = {key: data[key] for key in data.files}
+    return _table
+
+
+def estimate(table=None, **params):
+    """Estimated critical_time and sink_time (minutes, NaN if outside the table
+    or beyond simulation_time) for scalar or array parameters"""
+    table = table if table is not None else load()
+    p = engine.broadcast_params(**params)
+    scale, reserve = _nondimensional(p)
+    b, n = p['breached_compartments'], p['compartments']
+    inside = (n <= MAX_COMPARTMENTS) & (b >= 1) & (b <= n) \
+        & (reserve >= RESERVE_GRID[0]) & (reserve <= RESERVE_GRID[-1])
+    bi, ni = np.clip(b - 1, 0, MAX_COMPARTMENTS - 1), np.clip(n - 1, 0, MAX_COMPARTMENTS - 1)
+
+    pos = np.interp(reserve, table['reserve'], np.arange(len(table['reserve'])))
+    lo = np.clip(np.floor(pos).astype(int), 0, len(table['reserve']) - 2)
+    frac = pos - lo
+
+    out = {}
+    for key in ('critical_time', 'sink_time'):
+        column = table[key]
+        value = (1 - frac) * column[bi, ni, lo] + frac * column[bi, ni, lo + 1]
+        value = value * scale
+        out[key] = np.where(inside & (value <= p['simulation_time']), value, np.nan)
+    return out
+
+
+if __name__ == "__main__":
+    build_table()
+    print(f"Surrogate table written to {TABLE_PATH}")
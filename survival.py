@@ -0,0 +1,91 @@
+import numpy as np
+
+# Carpathia picked up the first lifeboat at 04:10, 270 minutes after the collision
+RESCUE_TIME = 270.0         # min
+
+# Median time to death in the water, an exponential fit through published
+# cold-water survival curves: about 30 min at -2 °C, 3 h at 10 °C
+MEDIAN_SURVIVAL_AT_MINUS_2 = 30.0   # min
+SURVIVAL_GROWTH = 0.15              # per °C
+WEIBULL_SHAPE = 3.0                 # hazard rises with time in the water
+
+
+def median_survival_time(temperature):
+    """Minutes after which half of the people immersed at this water temperature have died"""
+    return MEDIAN_SURVIVAL_AT_MINUS_2 * np.exp(SURVIVAL_GROWTH * (np.asarray(temperature, dtype=float) + 2))
+
+
+def weibull_scale(temperature):
+    return median_survival_time(temperature) / np.log(2) ** (1 / WEIBULL_SHAPE)
+
+
+def survival_probability(minutes, temperature):
+    """Weibull probability of still being alive after a time in the water"""
+    return np.exp(-(np.maximum(minutes, 0) / weibull_scale(temperature)) ** WEIBULL_SHAPE)
+
+
+def exposure(time_pts, temperature):
+    """Time in the water in units of the Weibull scale, accumulated along the
+    grid for a temperature (n,) that changes with time; someone immersed
+    between two grid times survives with exp(-(difference)^shape)"""
+    rate = 1 / weibull_scale(temperature)
+    return np.concatenate([[0.0], np.cumsum(np.diff(time_pts) * (rate[1:] + rate[:-1]) / 2)])
+
+
+def immersion_at_sinking(n_people, in_boats, sink_time):
+    """Simple assumption when no evacuation run is available: everyone not in a
+    boat enters the water when the ship goes down"""
+    immersion = np.full(n_people, np.nan)
+    if sink_time is not None:
+        immersion[in_boats:] = sink_time
+    return immersion
+
+
+def survivors_over_time(immersion_time, time_pts, temperature, forcing=None):
+    """Expected number of people alive at each time for each water temperature.
+
+    immersion_time is (N,) or (S, N) minutes with NaN for people never in the
+    water; time_pts is the (n,) output grid; temperature is a scalar or (K,).
+    A forcing.ForcingSeries with a temperature column replaces a scalar
+    temperature, the cold exposure then accumulating along the series.
+    Each immersion is counted at the first grid time at or after it, which is
+    exact for times taken from the same grid (as evacuation.evacuate gives).
+    The deaths then follow from one (K, ..., n, n) broadcast of the survival
+    curve against the immersion counts. Returns shape (K, ..., n), or
+    (..., n) for a scalar temperature.
+    """
+    time_pts = np.asarray(time_pts, dtype=float)
+    temps = np.atleast_1d(np.asarray(temperature, dtype=float))
+    immersion_time = np.asarray(immersion_time, dtype=float)
+    n = len(time_pts)
+
+    lead_shape = immersion_time.shape[:-1]
+    flat = immersion_time.reshape(-1, immersion_time.shape[-1])
+    immersed = ~np.isnan(flat)
+    bins = np.searchsorted(time_pts, np.where(immersed, flat, np.inf))      # n means never on this grid
+    rows = np.repeat(np.arange(len(flat)), flat.shape[1])
+    counts = np.bincount(rows * (n + 1) + bins.ravel(), minlength=len(flat) * (n + 1))
+    counts = counts.reshape(len(flat), n + 1)[:, :n]                       # (S, n) entering the water
+
+    # Probability that someone immersed at grid time j is still alive at grid time i
+    elapsed = time_pts[:, None] - time_pts[None, :]
+    if forcing is not None and 'temperature' in forcing.columns:
+        if np.ndim(temperature):
+            raise ValueError("A forcing temperature series cannot be combined with a temperature sweep")
+        dose = exposure(time_pts, forcing.interpolate(time_pts)['temperature'])
+        in_water = np.maximum(dose[:, None] - dose[None, :], 0)
+        alive = np.where(elapsed >= 0, np.exp(-in_water ** WEIBULL_SHAPE), 1.0)[None]
+    else:
+        alive = np.where(elapsed >= 0, survival_probability(elapsed[None], temps[:, None, None]), 1.0)
+
+    dead = np.einsum('kij,sj->ksi', 1 - alive, counts)
+    survivors = flat.shape[1] - dead
+    survivors = survivors.reshape((len(temps),) + lead_shape + (n,))
+    return survivors if np.ndim(temperature) else survivors[0]
+
+
+def survivors_at_rescue(immersion_time, time_pts, temperature, rescue_time=RESCUE_TIME, forcing=None):
+    """Expected survivors when help arrives, on the run's own grid extended to rescue_time"""
+    grid = np.union1d(time_pts, [rescue_time])
+    survivors = survivors_over_time(immersion_time, grid, temperature, forcing)
+    return survivors[..., np.searchsorted(grid, rescue_time)]
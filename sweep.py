@@ -0,0 +1,101 @@
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import engine
+
+CHUNK_SIZE = 2000           # scenarios per worker task
+SUMMARY_KEYS = ('critical_time', 'sink_time')
+
+
+def _run_chunk(n_points, keys, interpolate_events, params):
+    batch = engine.simulate_batch(n_points=n_points, **params)
+    if interpolate_events:
+        batch.update(engine.event_times(batch))
+    return {key: batch[key] for key in keys}
+
+
+def _write_chunk(func, args, paths, start, chunk):
+    out = func(*args, chunk)
+    for key, path in paths.items():
+        target = np.load(path, mmap_mode='r+')
+        target[start:start + len(out[key])] = out[key]
+        target.flush()
+        del target
+
+
+def map_chunks(func, arrays, workers=None, chunk_size=CHUNK_SIZE, args=(), out_dir=None, executor=None):
+    """Apply func(*args, chunk) to row chunks of a dict of equal-length arrays
+    across worker processes and gather the dict of arrays it returns.
+
+    func must be a module-level function so it can be sent to the workers,
+    and each of its outputs must have the same trailing shape for every
+    chunk. Workers write their rows straight into .npy files preallocated in
+    out_dir (a temporary directory if None) and send nothing back; the result
+    is memory-mapped views of those files, so it can be larger than memory.
+    Temporary files are unlinked at once and freed with the arrays on POSIX;
+    where mapped files cannot be removed (Windows) the result is read into
+    memory and unmapped first.
+    workers=1, or a single chunk, runs in this process and returns ordinary
+    arrays. An executor, e.g. a long-lived ProcessPoolExecutor shared by
+    many callers, is used instead of starting a pool for this call.
+    """
+    n_rows = len(next(iter(arrays.values())))
+    starts = range(0, n_rows, chunk_size)
+    chunks = [{name: value[start:start + chunk_size] for name, value in arrays.items()}
+              for start in starts]
+
+    workers = workers or os.cpu_count() or 1
+    if (workers == 1 or len(chunks) == 1) and out_dir is None:
+        parts = [func(*args, chunk) for chunk in chunks]
+        return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+    # One row through func gives the dtype and trailing shape of every output
+    probe = func(*args, {name: value[:1] for name, value in arrays.items()})
+    directory = out_dir if out_dir is not None else tempfile.mkdtemp(prefix='sweep-')
+    os.makedirs(directory, exist_ok=True)
+    paths = {key: os.path.join(directory, f"{key}.npy") for key in probe}
+    for key, value in probe.items():
+        value = np.asarray(value)
+        np.lib.format.open_memmap(paths[key], mode='w+', dtype=value.dtype, shape=(n_rows,) + value.shape[1:]).flush()
+
+    n = len(chunks)
+    if workers == 1 or n == 1:
+        for start, chunk in zip(starts, chunks):
+            _write_chunk(func, args, paths, start, chunk)
+    elif executor is not None:
+        list(executor.map(_write_chunk, [func] * n, [args] * n, [paths] * n, starts, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, n)) as pool:
+            list(pool.map(_write_chunk, [func] * n, [args] * n, [paths] * n, starts, chunks))
+
+    result = {key: np.load(path, mmap_mode='r') for key, path in paths.items()}
+    if out_dir is None:
+        try:
+            shutil.rmtree(directory)
+        except OSError:
+            # Open maps lock their files: copy, drop the maps and remove again
+            result = {key: np.array(value) for key, value in result.items()}
+            shutil.rmtree(directory)
+    return result
+
+
+def run_sweep(workers=None, chunk_size=CHUNK_SIZE, n_points=engine.N_POINTS, keys=SUMMARY_KEYS,
+              interpolate_events=False, out_dir=None, executor=None, **params):
+    """Run a parameter sweep split into chunks across worker processes.
+
+    Parameters are broadcast exactly as in engine.simulate_batch. Only the
+    outputs named in keys are sent back from the workers, concatenated in
+    scenario order. With interpolate_events, critical_time and sink_time are
+    interpolated between samples (engine.event_times) instead of snapped to
+    the grid. workers=1 runs everything in this process. Results of parallel
+    runs (or any run with out_dir, where they are kept as .npy files) are
+    memory-mapped, see map_chunks, which also explains executor.
+    """
+    p = engine.broadcast_params(**params)
+    engine.validate_params(p)
+    return map_chunks(_run_chunk, p, workers, chunk_size, args=(n_points, keys, interpolate_events),
+                      out_dir=out_dir, executor=executor)
@@ -0,0 +1,183 @@
+import math
+import time
+
+import numpy as np
+
+import adaptive
+import engine
+import events
+
+RESOLUTIONS = (25, 50, 100, 200, 400, 800, 1600, 3200, 6400)     # stepped solver time samples
+TOLERANCES = (1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9, 1e-10)  # adaptive solver rtol
+REPEATS = 3                 # timings are the best of this many runs
+ROUNDOFF = 1e-12            # relative volume errors below this count as exact
+ACCURACIES = (1e-3, 1e-6, 1e-9)  # volume errors the report picks the cheapest solver for
+
+# Every compartment breached, no wind and no cascade: the inflow is the
+# constant leak rate of the water_vol = leak_rate·t model in titanic.py and por.py
+LINEAR_CASE = {'compartments': 16, 'breached_compartments': 16, 'leak_rate': 400,
+               'wind_speed': 0, 'temperature': -2, 'simulation_time': 200, 'cascade_factor': 0.0}
+# The default ship, run long enough to sink
+CASCADE_CASE = {'simulation_time': 300}
+
+
+def linear_reference(**params):
+    """Closed-form solution for a constant inflow Q = leak_rate.
+
+    V = Q·t, the critical time of jane.py t = (V_total·ρ − m0)/(ρ·Q), and
+    sinking when 99.9% of the volume is flooded. Valid for LINEAR_CASE,
+    whose cascade_factor is 0.
+    """
+    p = dict(engine.DEFAULT_PARAMS, **params)
+    rho = engine.adjusted_density(p['water_density'], p['temperature'])
+    q = p['leak_rate']
+
+    def volume(t):
+        return np.minimum(q * np.asarray(t), p['ship_volume'])
+    return {
+        'volume': volume,
+        'critical_time': (p['ship_volume'] * rho - p['ship_mass']) / (rho * q),
+        'sink_time': 0.999 * p['ship_volume'] / q,
+    }
+
+
+def cascade_reference(**params):
+    """Exact piecewise-exponential solution of the cascading model (events.simulate_events)"""
+    p = dict(engine.DEFAULT_PARAMS, **params)
+    solution = events.simulate_events(**params)
+
+    def volume(t):
+        return np.minimum(events.volume_at(solution['segments'], t), p['ship_volume'])
+    return {
+        'volume': volume,
+        'critical_time': events.event_time(solution['events'], 'critical'),
+        'sink_time': events.event_time(solution['events'], 'sunk'),
+    }
+
+
+def _timed(func, **kwargs):
+    best = math.inf
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        out = func(**kwargs)
+        best = min(best, time.perf_counter() - start)
+    return out, best
+
+
+def _event_error(t, t_ref):
+    if t is None or t_ref is None:
+        return 0.0 if t is None and t_ref is None else math.inf
+    return abs(t - t_ref)
+
+
+def _row(reference, ship_volume, solver, setting, steps, evals, runtime, time_pts, water_vol,
+         critical_time, sink_time):
+    return {
+        'solver': solver,
+        'setting': setting,
+        'steps': steps,
+        'evals': evals,
+        'volume_error': float(np.max(np.abs(water_vol - reference['volume'](time_pts)))) / ship_volume,
+        'critical_error': _event_error(critical_time, reference['critical_time']),
+        'sink_error': _event_error(sink_time, reference['sink_time']),
+        'runtime': runtime,
+    }
+
+
+def _analytic(n_points=engine.N_POINTS, **params):
+    """events.simulate_events and its volume on the engine's default grid"""
+    solution = events.simulate_events(**params)
+    time_pts = np.linspace(0, dict(engine.DEFAULT_PARAMS, **params)['simulation_time'], n_points)
+    return solution, time_pts, events.volume_at(solution['segments'], time_pts)
+
+
+def _none(t):
+    return None if np.isnan(t) else float(t)
+
+
+def verify_case(params, reference, resolutions=RESOLUTIONS, tolerances=TOLERANCES):
+    """Error against reference and runtime of every solver at every resolution.
+
+    stepped is engine.simulate_batch at each number of time samples, its
+    event times interpolated by engine.event_times; its runtime includes the
+    engine's derived outputs (buoyancy, trim). adaptive is
+    adaptive.simulate_adaptive at each relative tolerance. analytic is
+    events.simulate_events, exact up to roundoff. volume_error is the
+    largest error in flooded volume over the solver's time points, as a
+    share of the ship volume; event errors are in minutes.
+    """
+    ship_volume = dict(engine.DEFAULT_PARAMS, **params)['ship_volume']
+    rows = []
+    for n_points in resolutions:
+        batch, runtime = _timed(engine.simulate_batch, n_points=n_points, **params)
+        times = engine.event_times(batch)
+        rows.append(_row(reference, ship_volume, 'stepped', f"n={n_points}", n_points - 1, n_points - 1,
+                         runtime, batch['time_pts'][0], batch['water_vol'][0],
+                         _none(times['critical_time'][0]), _none(times['sink_time'][0])))
+
+    for rtol in tolerances:
+        run, runtime = _timed(adaptive.simulate_adaptive, rtol=rtol, atol=rtol, **params)
+        rows.append(_row(reference, ship_volume, 'adaptive', f"rtol={rtol:g}", run['n_steps'], run['n_evals'],
+                         runtime, run['time_pts'], run['water_vol'], run['critical_time'], run['sink_time']))
+
+    (solution, time_pts, water_vol), runtime = _timed(_analytic, **params)
+    n_segments = len(solution['segments'])
+    rows.append(_row(reference, ship_volume, 'analytic', "exact", n_segments, n_segments, runtime,
+                     time_pts, water_vol, events.event_time(solution['events'], 'critical'),
+                     events.event_time(solution['events'], 'sunk')))
+    return rows
+
+
+def verify(resolutions=RESOLUTIONS, tolerances=TOLERANCES):
+    """verify_case rows for the constant-inflow case against the closed form
+    and for the cascading model against its exact event-driven solution"""
+    rows = [dict(row, case='linear')
+            for row in verify_case(LINEAR_CASE, linear_reference(**LINEAR_CASE), resolutions, tolerances)]
+    rows += [dict(row, case='cascade')
+             for row in verify_case(CASCADE_CASE, cascade_reference(**CASCADE_CASE), resolutions, tolerances)]
+    return rows
+
+
+def convergence_order(rows, case, solver, key='volume_error', floor=ROUNDOFF):
+    """Observed order p of error ∝ steps^-p, fitted over the rows whose error
+    is above floor; None when fewer than two are (the solver is exact there)"""
+    points = [(row['steps'], row[key]) for row in rows
+              if row['case'] == case and row['solver'] == solver and floor < row[key] < math.inf]
+    if len(points) < 2:
+        return None
+    steps, errors = np.log(np.array(points)).T
+    return float(-np.polyfit(steps, errors, 1)[0])
+
+
+def cheapest(rows, case, accuracy, solver=None, key='volume_error'):
+    """The fastest row of a case (and solver, if given) whose error is at
+    most accuracy, None if there is none"""
+    good = [row for row in rows if row['case'] == case and row[key] <= accuracy
+            and solver in (None, row['solver'])]
+    return min(good, key=lambda row: row['runtime']) if good else None
+
+
+def print_report(rows):
+    """Error, cost and observed order of each solver, and the cheapest setting of each per accuracy"""
+    for case in dict.fromkeys(row['case'] for row in rows):
+        print(f"\n{case}")
+        print(f"  {'solver':<10}{'setting':<14}{'steps':>8}{'evals':>8}{'volume err':>12}"
+              f"{'critical err':>14}{'sink err':>12}{'time (ms)':>11}")
+        for row in rows:
+            if row['case'] == case:
+                print(f"  {row['solver']:<10}{row['setting']:<14}{row['steps']:>8}{row['evals']:>8}"
+                      f"{row['volume_error']:>12.2e}{row['critical_error']:>14.2e}{row['sink_error']:>12.2e}"
+                      f"{row['runtime'] * 1e3:>11.2f}")
+        for solver in ('stepped', 'adaptive'):
+            order = convergence_order(rows, case, solver)
+            print(f"  observed order, {solver}: " + ("exact" if order is None else f"{order:.2f}"))
+        for accuracy in ACCURACIES:
+            choices = [cheapest(rows, case, accuracy, solver) for solver in ('stepped', 'adaptive', 'analytic')]
+            choices = sorted((row for row in choices if row is not None), key=lambda row: row['runtime'])
+            print(f"  volume error <= {accuracy:g}: "
+                  + (", ".join(f"{row['solver']} {row['setting']} ({row['runtime'] * 1e3:.2f} ms)" for row in choices)
+                     or "no solver"))
+
+
+if __name__ == "__main__":
+    print_report(verify())